@@ -1 +1,17 @@
 """pytest configuration."""
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point XDG_CACHE_HOME at a per-test directory.
+
+    MainView persists hashes under the user cache directory; tests must not
+    read or write the real one.
+    """
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
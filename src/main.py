@@ -1,6 +1,8 @@
 """Duplicate file scanner application built with Flet."""
 
+import dbm
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
@@ -14,6 +16,7 @@ from src.models.file_meta import FileMeta
 from src.models.duplicate_group import DuplicateGroup
 from src.models.scan_config import ScanConfig
 from src.services.detector import DuplicateDetector
+from src.services.hash_cache import HashCache
 from src.services.hasher import Hasher
 
 # Configure logging
@@ -44,6 +47,7 @@ class MainView(HomeView):
             selected_folders,
         )
 
+        hash_cache: Optional[HashCache] = None
         try:
             # Show progress view
             self._show_progress()
@@ -57,13 +61,15 @@ class MainView(HomeView):
             # Create optimized configuration
             config = ScanConfig(
                 chunk_size=65536,
-                hash_algorithm="xxhash64",
+                hash_algorithm="xxh3_128",
                 parallel_workers=4,
                 storage_type="ssd",
             )
 
-            # Initialize services with optimized config
-            hasher = Hasher(config)
+            # Initialize services with optimized config. Hashes persist across
+            # scans, keyed by path, size and mtime, so unchanged files are not reread.
+            hash_cache = self._open_hash_cache()
+            hasher = Hasher(config, cache=hash_cache)
             detector = DuplicateDetector()
 
             # Define progress callback
@@ -87,6 +93,28 @@ class MainView(HomeView):
         except (OSError, FileNotFoundError) as ex:
             logging.error("Scan failed due to filesystem error: %s", ex)
             self._show_error(f"Scan failed: {ex}")
+        finally:
+            if hash_cache is not None:
+                hash_cache.close()
+
+    @staticmethod
+    def _open_hash_cache() -> Optional[HashCache]:
+        """スキャン間で共有する永続ハッシュキャッシュを開く。
+
+        ``$XDG_CACHE_HOME``(未設定なら ``~/.cache``)配下に保存する。
+
+        Returns:
+            Optional[HashCache]: 開いたキャッシュ。開けない場合はNoneを返し、
+            キャッシュなしでスキャンを続行する。
+        """
+        cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        path = Path(cache_home) / "duplicate_scan" / "hashes"
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            return HashCache(path)
+        except dbm.error as err:
+            logging.warning("Hash cache unavailable, scanning without it: %s", err)
+            return None
 
     def _collect_files(self, folders: List[str]) -> List[FileMeta]:
         """指定されたフォルダからファイルを収集する。
@@ -179,15 +207,7 @@ class MainView(HomeView):
 
     def _show_error(self, message: str) -> None:
         """エラーメッセージを表示する"""
-        if not self.page:
-            return
-
-        self.page.snack_bar = ft.SnackBar(
-            content=ft.Text(message),
-            bgcolor=ft.Colors.RED_600,
-        )
-        self.page.snack_bar.open = True
-        self.page.update()
+        self._show_snack(message, ft.Colors.RED_600)
 
     def _on_scan_cancelled(self) -> None:
         """スキャンがキャンセルされたときの処理"""
@@ -1,6 +1,7 @@
 """Duplicate group data model."""
 
 from dataclasses import dataclass
+from functools import cached_property
 
 from .file_meta import FileMeta
 
@@ -11,7 +12,11 @@ class DuplicateGroup:
 
     files: list[FileMeta]
 
-    @property
+    @cached_property
     def total_size(self) -> int:
-        """Calculate total size from all files."""
+        """Calculate total size from all files.
+
+        The sum is computed on first access and cached, since ``files`` is not
+        modified after the group is built.
+        """
         return sum(file.size for file in self.files)
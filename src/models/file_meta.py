@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class FileMeta:
     """Metadata for a file including path, size, and hash information."""
 
@@ -8,7 +8,10 @@ MIN_CHUNK_SIZE = 4096
 MIN_PARALLEL_WORKERS = 1
 MAX_PARALLEL_WORKERS = 16
 SUPPORTED_HASH_ALGORITHMS: tuple[str, ...] = (
+    "xxh3_128",
+    "xxh3_64",
     "xxhash64",
+    "blake2b",
     "sha256",
     "sha512",
     "md5",
@@ -22,13 +25,13 @@ class ScanConfig:
 
     Attributes:
         chunk_size: Chunk size in bytes (power of two, >= 4096) used for partial/full hashing.
-        hash_algorithm: Hash algorithm name (sha256/sha512/md5/sha1/xxhash64).
+        hash_algorithm: Hash algorithm name (sha256/sha512/md5/sha1/xxhash64/xxh3_64/xxh3_128/blake2b).
         parallel_workers: Number of worker processes (between 1 and 16).
         storage_type: Underlying storage type hint ("ssd" or "hdd").
     """
 
     chunk_size: int = 65536
-    hash_algorithm: str = "xxhash64"
+    hash_algorithm: str = "xxh3_128"
     parallel_workers: int = 4
     storage_type: Literal["ssd", "hdd"] = "ssd"
 
@@ -1,6 +1,7 @@
 """Servicesパッケージ"""
 
 from .deleter import DeleteResult, Deleter
+from .hash_cache import HashCache
 from .hasher import Hasher
 
-__all__ = ["DeleteResult", "Deleter", "Hasher"]
+__all__ = ["DeleteResult", "Deleter", "HashCache", "Hasher"]
@@ -1,11 +1,16 @@
 """Deleter service for safely moving files to trash."""
 
+import os
 from dataclasses import dataclass, field
 from typing import Callable, List, Optional, Tuple
 
 from send2trash import send2trash
 
 from ..models.file_meta import FileMeta
+from .hash_cache import HashCache
+
+# Units used by format_size, indexed by power of 1024.
+_SIZE_UNITS = ("B", "KB", "MB", "GB")
 
 
 @dataclass
@@ -22,10 +27,22 @@ class DeleteResult:
 class Deleter:
     """Service for safely deleting files by moving them to trash."""
 
+    def __init__(self, hash_cache: Optional[HashCache] = None) -> None:
+        """
+        Initialize the deleter.
+
+        Args:
+            hash_cache: Optional hash cache whose entries for successfully
+                trashed files are discarded, so the persistent cache does not
+                keep hashes of files that no longer exist.
+        """
+        self.hash_cache = hash_cache
+
     def delete_files(
         self,
         files: List[FileMeta],
         progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        callback_batch_size: int = 1,
     ) -> DeleteResult:
         """
         Delete files by moving them to trash.
@@ -34,29 +51,71 @@ class Deleter:
             files: List of files to delete.
             progress_callback: Optional callback for progress updates.
                 Receives (file_path, current_index, total_count).
+            callback_batch_size: Invoke progress_callback only every this many
+                files, and always for the last one. GUI callers deleting large
+                batches should pass e.g. ``max(1, len(files) // 100)``.
 
         Returns:
             DeleteResult with details of the operation.
+
+        Raises:
+            ValueError: If callback_batch_size is less than 1.
         """
+        if callback_batch_size < 1:
+            raise ValueError("callback_batch_size must be at least 1")
+
         result = DeleteResult()
         total_count = len(files)
 
-        for index, file_meta in enumerate(files):
-            file_path = file_meta.path
+        # Files are trashed one at a time: send2trash picks a free name in the
+        # trash without locking, so concurrent calls for files sharing a
+        # basename (the usual case for duplicates) can overwrite each other.
+        for done, file_meta in enumerate(files, start=1):
+            error = self._trash_one(file_meta.path)
+            self._record_outcome(result, file_meta, error)
+            if error is None and self.hash_cache is not None:
+                self.hash_cache.discard(os.path.abspath(file_meta.path))
+            if progress_callback and (
+                done % callback_batch_size == 0 or done == total_count
+            ):
+                progress_callback(file_meta.path, done, total_count)
 
-            try:
-                send2trash(file_path)
-                result.deleted_files.append(file_path)
-                result.total_deleted += 1
-                result.space_saved += file_meta.size
-            except Exception as e:
-                result.failed_files.append((file_path, str(e)))
-                result.total_failed += 1
+        return result
 
-            if progress_callback:
-                progress_callback(file_path, index + 1, total_count)
+    @staticmethod
+    def _trash_one(file_path: str) -> Optional[str]:
+        """
+        Move a single file to trash.
 
-        return result
+        Args:
+            file_path: Path of the file to move.
+
+        Returns:
+            None on success, otherwise the error message.
+        """
+        try:
+            send2trash(file_path)
+        except Exception as e:
+            return str(e)
+        return None
+
+    @staticmethod
+    def _record_outcome(
+        result: DeleteResult, file_meta: FileMeta, error: Optional[str]
+    ) -> None:
+        """
+        Add the outcome of a single deletion to the result.
+
+        Space saved is taken from the size recorded at scan time, so no file is
+        stat()ed again during deletion.
+        """
+        if error is None:
+            result.deleted_files.append(file_meta.path)
+            result.total_deleted += 1
+            result.space_saved += file_meta.size
+        else:
+            result.failed_files.append((file_meta.path, error))
+            result.total_failed += 1
 
     @staticmethod
     def format_size(size_bytes: int) -> str:
@@ -69,11 +128,8 @@ class Deleter:
         Returns:
             Formatted size string (e.g., "1.5 MB").
         """
-        if size_bytes >= 1024 * 1024 * 1024:
-            return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
-        elif size_bytes >= 1024 * 1024:
-            return f"{size_bytes / (1024 * 1024):.1f} MB"
-        elif size_bytes >= 1024:
-            return f"{size_bytes / 1024:.1f} KB"
-        else:
+        if size_bytes < 1024:
             return f"{size_bytes} B"
+        # Each unit is 2**10 times the previous one, so the bit length picks it.
+        unit_index = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (unit_index * 10)):.1f} {_SIZE_UNITS[unit_index]}"
@@ -1,7 +1,9 @@
 """Duplicate Detector service."""
 
 from typing import List, Dict, Iterable, Callable, TypeVar, Optional
+from collections import Counter
 from collections.abc import Hashable
+from operator import attrgetter
 import logging
 
 from src.models.file_meta import FileMeta
@@ -12,6 +14,12 @@ logger = logging.getLogger(__name__)
 
 K = TypeVar("K", bound=Hashable)
 
+# C-level field getters used as grouping keys (cheaper than per-call lambdas).
+_size = attrgetter("size")
+_partial_hash = attrgetter("partial_hash")
+_full_hash = attrgetter("full_hash")
+_size_and_hashes = attrgetter("size", "partial_hash", "full_hash")
+
 
 class DuplicateDetector:
     """Service for detecting duplicate files based on size and hash."""
@@ -25,46 +33,21 @@ class DuplicateDetector:
         Returns:
             List of duplicate groups containing 2+ files
         """
-        if not files:
+        # A duplicate needs at least two files, so skip the grouping pass.
+        if len(files) < 2:
             return []
 
-        # Step 1: Group by size
-        size_groups = self._group_by_key(files, lambda f: f.size)
-
-        # Step 2: Filter groups with 2+ files and group by partial hash
-        partial_hash_groups = []
-        for files_with_same_size in size_groups.values():
-            if len(files_with_same_size) >= 2:
-                # Filter out files with no partial_hash
-                files_with_partial = [
-                    f for f in files_with_same_size if f.partial_hash is not None
-                ]
-                if len(files_with_partial) >= 2:
-                    partial_groups = self._group_by_key(
-                        files_with_partial, lambda f: f.partial_hash
-                    )
-                    # Add groups with 2+ files sharing same partial hash
-                    partial_hash_groups.extend(
-                        [group for group in partial_groups.values() if len(group) >= 2]
-                    )
-
-        # Step 3: Group by full hash to find exact duplicates
-        duplicate_groups = []
-        for files_with_same_partial in partial_hash_groups:
-            # Filter out files with no full_hash
-            files_with_full = [
-                f for f in files_with_same_partial if f.full_hash is not None
-            ]
-            if len(files_with_full) >= 2:
-                full_hash_groups = self._group_by_key(
-                    files_with_full, lambda f: f.full_hash
-                )
-                # Create duplicate groups for exact matches (2+ files)
-                for exact_duplicates in full_hash_groups.values():
-                    if len(exact_duplicates) >= 2:
-                        duplicate_groups.append(DuplicateGroup(files=exact_duplicates))
-
-        return duplicate_groups
+        # Files with equal full hashes necessarily share size and partial hash,
+        # so a single dict pass over the composite key replaces the nested
+        # size -> partial -> full grouping loops. The filter is streamed into
+        # the grouping pass rather than copied into an intermediate list.
+        hashed_files = (
+            f for f in files if f.partial_hash is not None and f.full_hash is not None
+        )
+        groups = self._group_by_key(hashed_files, _size_and_hashes)
+        return [
+            DuplicateGroup(files=group) for group in groups.values() if len(group) >= 2
+        ]
 
     def find_duplicates_optimized(
         self,
@@ -137,11 +120,10 @@ class DuplicateDetector:
         Returns:
             Files that belong to size buckets with >= 2 members.
         """
-        size_groups = self._group_by_key(files, lambda f: f.size)
-        size_candidates: List[FileMeta] = []
-        for group in size_groups.values():
-            if len(group) >= 2:
-                size_candidates.extend(group)
+        # Counting sizes avoids building a list per size bucket, and the
+        # filter keeps candidates in input order.
+        size_counts = Counter(map(_size, files))
+        size_candidates = [f for f in files if size_counts[f.size] >= 2]
 
         if progress_callback:
             progress_callback("Grouping by size", len(files), len(files))
@@ -176,9 +158,7 @@ class DuplicateDetector:
                 len(size_candidates),
             )
 
-        partial_groups = self._group_by_key(
-            files_with_partial, lambda f: f.partial_hash
-        )
+        partial_groups = self._group_by_key(files_with_partial, _partial_hash)
         partial_candidates: List[FileMeta] = []
         for group in partial_groups.values():
             if len(group) >= 2:
@@ -213,7 +193,7 @@ class DuplicateDetector:
                 len(partial_candidates),
             )
 
-        full_groups = self._group_by_key(files_with_full, lambda f: f.full_hash)
+        full_groups = self._group_by_key(files_with_full, _full_hash)
         duplicate_groups: List[DuplicateGroup] = []
         for exact_duplicates in full_groups.values():
             if len(exact_duplicates) >= 2:
@@ -233,9 +213,8 @@ class DuplicateDetector:
             Dictionary mapping keys to lists of items
         """
         groups: Dict[K, List[FileMeta]] = {}
+        # Bind the method once so the loop does a local load, not an attribute lookup.
+        setdefault = groups.setdefault
         for item in items:
-            key = key_func(item)
-            if key not in groups:
-                groups[key] = []
-            groups[key].append(item)
+            setdefault(key_func(item), []).append(item)
         return groups
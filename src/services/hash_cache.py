@@ -0,0 +1,152 @@
+"""HashCacheサービス - ハッシュ計算結果のキャッシュ"""
+
+import dbm
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# キャッシュするハッシュの種類(部分ハッシュと完全ハッシュ)
+HASH_KINDS = ("partial", "full")
+
+# 保存する値でスタンプとハッシュ値(16進数文字列)を区切る文字
+_STAMP_SEPARATOR = "|"
+
+# dbmの読み書きで発生しうる例外。キャッシュの失敗でハッシュ計算を失敗させない
+_CACHE_ERRORS: tuple[type[Exception], ...] = (UnicodeError, *dbm.error)
+
+
+class HashCache:
+    """ハッシュ計算結果をファイルの状態ごとにキャッシュするクラス
+
+    キーはハッシュの種類とファイルのパスで決まり、値にはハッシュ値と一緒に
+    計算条件とファイルの状態を表すスタンプ(アルゴリズム・チャンクサイズ・
+    サイズ・更新時刻など)を保存する。取得時にスタンプが一致しなければ
+    未登録として扱い、再計算した値で同じエントリを上書きする。
+    ファイルを編集してもエントリは増えないため、永続化したキャッシュの
+    大きさはハッシュ計算したパスの数までに収まる。削除したファイルの
+    エントリは ``discard`` で取り除く。
+    パスを指定すると ``dbm`` でディスクに永続化し、
+    指定しない場合はプロセス内の辞書に保持する。
+    値は16進数文字列のみのため、pickleを使う ``shelve`` ではなく ``dbm`` を直接使う。
+    dbmのキーはファイル名と同じく ``os.fsencode`` でバイト列にするため、
+    UTF-8として不正なファイル名もそのまま扱える。dbmの読み書きに失敗した
+    場合は未登録として扱い、呼び出し側のハッシュ計算は続行させる。
+    ``close`` 後に使用すると ``ValueError`` を送出する。
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None) -> None:
+        """HashCacheを初期化する
+
+        Args:
+            path: キャッシュファイルのパス。Noneの場合はメモリ上にのみ保持する。
+        """
+        self._memory: dict[str, str] = {}
+        self._db = dbm.open(str(path), "c") if path is not None else None
+        self._closed = False
+        # hash_manyのワーカースレッドから同時に参照されるため排他する
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(path: str, kind: str) -> str:
+        """ハッシュの種類とパスからキャッシュキーを作る"""
+        return f"{kind}:{path}"
+
+    def _check_open(self) -> None:
+        """閉じたキャッシュへのアクセスを検出する(ロック取得中に呼ぶ)"""
+        if self._closed:
+            raise ValueError("HashCache is closed")
+
+    def get(self, path: str, kind: str, stamp: str) -> Optional[str]:
+        """キャッシュ済みのハッシュ値を取得する
+
+        Args:
+            path: ファイルの絶対パス
+            kind: ハッシュの種類("partial" または "full")
+            stamp: 計算条件とファイルの現在の状態を表す文字列
+
+        Returns:
+            ハッシュ値。未登録またはスタンプが一致しない場合はNone。
+
+        Raises:
+            ValueError: キャッシュが閉じられている場合
+        """
+        key = self._key(path, kind)
+        with self._lock:
+            self._check_open()
+            if self._db is None:
+                entry = self._memory.get(key)
+            else:
+                try:
+                    raw = self._db.get(os.fsencode(key))
+                    entry = raw.decode("ascii") if raw is not None else None
+                except _CACHE_ERRORS as err:
+                    logger.debug("Hash cache lookup failed for %r: %s", key, err)
+                    return None
+        if entry is None:
+            return None
+        cached_stamp, _, hash_value = entry.rpartition(_STAMP_SEPARATOR)
+        return hash_value if cached_stamp == stamp else None
+
+    def set(self, path: str, kind: str, stamp: str, hash_value: str) -> None:
+        """ハッシュ値をキャッシュに保存する(既存のエントリは上書きする)
+
+        Args:
+            path: ファイルの絶対パス
+            kind: ハッシュの種類("partial" または "full")
+            stamp: ハッシュ計算時の計算条件とファイルの状態を表す文字列
+            hash_value: ハッシュ値(16進数文字列)
+
+        Raises:
+            ValueError: キャッシュが閉じられている場合
+        """
+        key = self._key(path, kind)
+        entry = f"{stamp}{_STAMP_SEPARATOR}{hash_value}"
+        with self._lock:
+            self._check_open()
+            if self._db is None:
+                self._memory[key] = entry
+            else:
+                try:
+                    self._db[os.fsencode(key)] = entry
+                except _CACHE_ERRORS as err:
+                    logger.debug("Hash cache store failed for %r: %s", key, err)
+
+    def discard(self, path: str) -> None:
+        """ファイルのエントリを種類にかかわらず削除する(未登録なら何もしない)
+
+        Args:
+            path: ファイルの絶対パス
+
+        Raises:
+            ValueError: キャッシュが閉じられている場合
+        """
+        with self._lock:
+            self._check_open()
+            for kind in HASH_KINDS:
+                key = self._key(path, kind)
+                if self._db is None:
+                    self._memory.pop(key, None)
+                    continue
+                try:
+                    encoded = os.fsencode(key)
+                    if encoded in self._db:
+                        del self._db[encoded]
+                except _CACHE_ERRORS as err:
+                    logger.debug("Hash cache discard failed for %r: %s", key, err)
+
+    def close(self) -> None:
+        """キャッシュを閉じる(永続化している場合はファイルも閉じる)"""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+            self._closed = True
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._check_open()
+            return len(self._memory) if self._db is None else len(self._db)
@@ -2,17 +2,50 @@
 
 import hashlib
 import logging
+import os
+import sys
+from collections import Counter
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import partial
+from io import FileIO
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Callable, Optional, Union, overload
+from typing import Any, Callable, Iterable, Iterator, Optional, Union, overload
 
 import xxhash
 
 from src.models.file_meta import FileMeta
 from src.models.scan_config import ScanConfig
+from src.services.hash_cache import HashCache
 
 logger = logging.getLogger(__name__)
 
+# ScanConfigを使わない場合の段階別並列ハッシュのワーカー数
+DEFAULT_PARALLEL_WORKERS = 4
+
+# hash_manyのデフォルトワーカー数(I/O待ちが主体のためCPU数より多めに取る)
+DEFAULT_HASH_MANY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# xxhashのアルゴリズム名とハッシュオブジェクトの生成関数
+_XXHASH_FACTORIES: dict[str, Callable[[], Any]] = {
+    "xxhash64": xxhash.xxh64,
+    "xxh3_64": xxhash.xxh3_64,
+    "xxh3_128": xxhash.xxh3_128,
+}
+
+# blake2bのダイジェスト長(バイト)。内容の一致判定には128bitで十分なため短くする
+BLAKE2B_DIGEST_SIZE = 16
+
+# ストリーミング読み込み時の最小読み込みサイズ(hashlib.file_digestと同じ256KiB)
+STREAM_READ_SIZE = 1 << 18
+
+# キャッシュ上のファイルの絶対パス・ハッシュの種類・スタンプ
+_CacheKey = tuple[str, str, str]
+
+# prefetchで先読みを予告するファイル先頭のサイズ。以降は順次読み込みの先読みに任せる
+PREFETCH_SIZE = 1 << 20
+
 
 class Hasher:
     """ファイルハッシュ計算を行うサービスクラス
@@ -28,6 +61,7 @@ class Hasher:
         hash_algorithm: Optional[str] = None,
         *,
         config: Optional[ScanConfig] = None,
+        cache: Optional[HashCache] = None,
     ) -> None: ...
 
     @overload
@@ -37,6 +71,7 @@ class Hasher:
         hash_algorithm: None = None,
         *,
         config: Optional[ScanConfig] = None,
+        cache: Optional[HashCache] = None,
     ) -> None: ...
 
     def __init__(
@@ -45,6 +80,7 @@ class Hasher:
         hash_algorithm: Optional[str] = None,
         *,
         config: Optional[ScanConfig] = None,
+        cache: Optional[HashCache] = None,
     ) -> None:
         """Hasherを初期化する
 
@@ -52,13 +88,22 @@ class Hasher:
             chunk_size: ファイル読み込みのチャンクサイズ(バイト単位) または ScanConfig。
                 旧API互換のため位置引数で指定可能。
             hash_algorithm: 使用するハッシュアルゴリズム。デフォルトはSHA256。
+                "blake2b" は128bitのダイジェストで計算する。
+                "xxh3_64" / "xxh3_128" はSIMDで高速に計算できる非暗号学的なハッシュ。
             config: ScanConfigオブジェクト。指定された場合は他のパラメータを無視。
+                ``parallel_workers`` は並列ハッシュ計算のワーカー数として使う。
+            cache: ハッシュ値のキャッシュ。指定された場合、パス・サイズ・更新時刻が
+                同じファイルは再読み込みせずキャッシュの値を返す。
         """
+        self.cache = cache
+        self.parallel_workers = DEFAULT_PARALLEL_WORKERS
+
         if config is not None:
             if not isinstance(config, ScanConfig):
                 raise ValueError("config must be a ScanConfig object")
             self.chunk_size = config.chunk_size
             self.hash_algorithm = config.hash_algorithm
+            self.parallel_workers = config.parallel_workers
         elif isinstance(chunk_size, ScanConfig):
             if hash_algorithm is not None:
                 raise ValueError(
@@ -66,6 +111,7 @@ class Hasher:
                 )
             self.chunk_size = chunk_size.chunk_size
             self.hash_algorithm = chunk_size.hash_algorithm
+            self.parallel_workers = chunk_size.parallel_workers
         elif isinstance(chunk_size, int):
             self.chunk_size = chunk_size
             self.hash_algorithm = (
@@ -81,21 +127,92 @@ class Hasher:
 
         # ハッシュアルゴリズムの検証
         self._validate_hash_algorithm()
+        # ファイルごとに名前から引き直さないよう、生成関数を一度だけ解決する
+        self._new_hash_object = self._resolve_hash_factory()
+
+        # 空ファイルは読み込まずに済むよう、空データのハッシュ値を事前に計算する
+        self._empty_hash = sys.intern(self._get_hash_object().hexdigest())
 
     def _validate_hash_algorithm(self) -> None:
         """ハッシュアルゴリズムが有効か検証する"""
-        if self.hash_algorithm == "xxhash64":
-            return  # xxhash64は常に有効
+        if self.hash_algorithm in _XXHASH_FACTORIES:
+            return  # xxhashのアルゴリズムは常に有効
         elif self.hash_algorithm in hashlib.algorithms_available:
             return  # hashlibでサポートされているアルゴリズム
         else:
             raise ValueError(f"Unsupported hash algorithm: {self.hash_algorithm}")
 
+    def _resolve_hash_factory(self) -> Callable[[], Any]:
+        """ハッシュアルゴリズムに対応するハッシュオブジェクトの生成関数を返す"""
+        xxhash_factory = _XXHASH_FACTORIES.get(self.hash_algorithm)
+        if xxhash_factory is not None:
+            return xxhash_factory
+        if self.hash_algorithm == "blake2b":
+            return partial(hashlib.blake2b, digest_size=BLAKE2B_DIGEST_SIZE)
+        # sha256などはhashlib.newを経由しない専用のコンストラクタを使う
+        constructor = getattr(hashlib, self.hash_algorithm, None)
+        if callable(constructor):
+            return constructor
+        return partial(hashlib.new, self.hash_algorithm)
+
     def _get_hash_object(self) -> Any:
         """ハッシュオブジェクトを取得する"""
-        if self.hash_algorithm == "xxhash64":
-            return xxhash.xxh64()
-        return hashlib.new(self.hash_algorithm)
+        return self._new_hash_object()
+
+    def _cache_key(
+        self,
+        path: Path,
+        kind: str,
+        stat_result: Optional[os.stat_result] = None,
+    ) -> Optional[_CacheKey]:
+        """ファイルのキャッシュ上のパス・種類と、計算条件と状態を表すスタンプを返す
+
+        スタンプはアルゴリズム・チャンクサイズ・サイズ・更新時刻(ナノ秒)から作る。
+        スキャンで集めたパスは絶対パスのため、シンボリックリンクの解決はせず
+        ``os.path.abspath`` のみで正規化し、追加のシステムコールを避ける。
+        呼び出し側でstat済みの場合は ``stat_result`` を渡して再取得を避ける。
+        キャッシュ未設定の場合はNoneを返す。
+        """
+        if self.cache is None:
+            return None
+        if stat_result is None:
+            stat_result = path.stat()
+        return (
+            os.path.abspath(path),
+            kind,
+            f"{self.hash_algorithm}:{self.chunk_size}:"
+            f"{stat_result.st_size}:{stat_result.st_mtime_ns}",
+        )
+
+    def _cache_lookup(self, cache_key: Optional[_CacheKey]) -> Optional[str]:
+        """キャッシュ済みのハッシュ値を返す(キャッシュ未設定・未登録ならNone)"""
+        if cache_key is None or self.cache is None:
+            return None
+        cached = self.cache.get(*cache_key)
+        return sys.intern(cached) if cached is not None else None
+
+    def _finish_hash(self, cache_key: Optional[_CacheKey], hash_value: str) -> str:
+        """計算したハッシュ値をインターンし、キャッシュキーがあれば保存して返す
+
+        同じ内容のファイルのハッシュ値が同一の文字列オブジェクトを共有するため、
+        重複判定の辞書では比較が同一性チェックで済み、メモリも重複しない。
+        """
+        hash_value = sys.intern(hash_value)
+        if cache_key is not None and self.cache is not None:
+            self.cache.set(*cache_key, hash_value)
+        return hash_value
+
+    def _stream_buffer(self) -> bytearray:
+        """ストリーミング読み込み用のバッファを作成する
+
+        小さいチャンクサイズのまま全体を読むとPython側のループ回数が増えるため、
+        読み込みサイズは ``STREAM_READ_SIZE`` 以上にする。
+        """
+        return bytearray(max(self.chunk_size, STREAM_READ_SIZE))
+
+    def _partial_covers_file(self, file_size: int) -> bool:
+        """部分ハッシュがファイル全体を対象にするサイズかどうかを返す"""
+        return file_size <= 2 * self.chunk_size
 
     def calculate_partial_hash(self, file_path: Union[str, Path]) -> str:
         """ファイルの部分ハッシュを計算する(最初と最後のチャンク)
@@ -115,41 +232,53 @@ class Hasher:
         """
         path = Path(file_path)
 
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-
         try:
-            file_size = path.stat().st_size
+            stat_result = path.stat()
+            cache_key = self._cache_key(path, "partial", stat_result)
+            if (cached := self._cache_lookup(cache_key)) is not None:
+                return cached
+
+            file_size = stat_result.st_size
+
+            if file_size == 0:
+                return self._finish_hash(cache_key, self._empty_hash)
 
             # ファイルが2*chunk_size未満の場合は全体を読み込む
             if file_size <= 2 * self.chunk_size:
-                with open(path, "rb") as f:
+                # 1回の読み込みで済むため、バッファリングせずに読む
+                with open(path, "rb", buffering=0) as f:
                     content = f.read()
                 hash_obj = self._get_hash_object()
                 hash_obj.update(content)
-                return hash_obj.hexdigest()
+                return self._finish_hash(cache_key, hash_obj.hexdigest())
 
-            # 最初のチャンクと最後のチャンクを読み込む
+            # 最初のチャンクと最後のチャンクを同じバッファに読み込み、
+            # チャンクごとのbytes生成とバッファリング層でのコピーを避ける
             hash_obj = self._get_hash_object()
-            with open(path, "rb") as f:
+            buffer = bytearray(self.chunk_size)
+            view = memoryview(buffer)
+            with open(path, "rb", buffering=0) as f:
                 # 最初のチャンク
-                first_chunk = f.read(self.chunk_size)
-                hash_obj.update(first_chunk)
+                read_size = f.readinto(buffer)
+                hash_obj.update(view[:read_size])
 
                 # 最後のチャンク
-                f.seek(-self.chunk_size, 2)
-                last_chunk = f.read(self.chunk_size)
-                hash_obj.update(last_chunk)
+                f.seek(-self.chunk_size, os.SEEK_END)
+                read_size = f.readinto(buffer)
+                hash_obj.update(view[:read_size])
 
-            return hash_obj.hexdigest()
+            return self._finish_hash(cache_key, hash_obj.hexdigest())
 
+        except FileNotFoundError:
+            # 事前のexists()確認は行わず、stat/openの失敗から判定する
+            raise FileNotFoundError(f"File not found: {file_path}") from None
         except OSError as e:
             raise OSError(f"Failed to read file {file_path}: {e}") from e
 
     def _calculate_hashes_parallel(
         self,
         files: list[FileMeta],
-        max_workers: int,
+        max_workers: Optional[int],
         hash_func: Callable[[Union[str, Path]], str],
         attr_name: str,
         log_prefix: str,
@@ -158,6 +287,11 @@ class Hasher:
         if not files:
             return
 
+        # ファイル数より多いスレッドは起動しない
+        if max_workers is None:
+            max_workers = self.parallel_workers
+        max_workers = min(max_workers, len(files))
+
         def _worker(
             file_meta: FileMeta,
         ) -> tuple[FileMeta, str | None, Exception | None]:
@@ -180,7 +314,7 @@ class Hasher:
     def calculate_partial_hashes_parallel(
         self,
         files: list[FileMeta],
-        max_workers: int = 4,
+        max_workers: Optional[int] = None,
     ) -> None:
         """複数ファイルの部分ハッシュを並列に計算する。
 
@@ -189,7 +323,8 @@ class Hasher:
 
         Args:
             files: ハッシュ計算対象の FileMeta リスト。
-            max_workers: 並列処理に利用するワーカースレッド数。デフォルトは4。
+            max_workers: 並列処理に利用するワーカースレッド数。Noneの場合は
+                ``parallel_workers`` (ScanConfig指定時はその値、既定は4)を使う。
 
         Returns:
             None: FileMeta.partial_hash をインプレースで更新する。
@@ -205,32 +340,247 @@ class Hasher:
     def calculate_full_hashes_parallel(
         self,
         files: list[FileMeta],
-        max_workers: int = 4,
+        max_workers: Optional[int] = None,
     ) -> None:
         """複数ファイルの完全ハッシュを並列に計算する。
 
         FileMeta の ``full_hash`` をインプレースで更新する。
+        部分ハッシュ計算済みで、部分ハッシュがファイル全体を覆うサイズ
+        (2 * chunk_size 以下)のファイルは再読み込みせず部分ハッシュを流用する。
+        残りのファイルはサイズの大きい順に計算を開始する。
         1ファイルでエラーが発生しても処理を継続し、警告ログのみを出力する。
 
         Args:
             files: ハッシュ計算対象の FileMeta リスト。
-            max_workers: 並列処理に利用するワーカースレッド数。デフォルトは4。
+            max_workers: 並列処理に利用するワーカースレッド数。Noneの場合は
+                ``parallel_workers`` (ScanConfig指定時はその値、既定は4)を使う。
 
         Returns:
             None: FileMeta.full_hash をインプレースで更新する。
         """
+        pending: list[FileMeta] = []
+        for file_meta in files:
+            if file_meta.partial_hash is not None and self._partial_covers_file(
+                file_meta.size
+            ):
+                file_meta.full_hash = file_meta.partial_hash
+            else:
+                pending.append(file_meta)
+
+        # 大きいファイルから投入し、最後に巨大ファイル1つだけが残るのを避ける
+        pending.sort(key=attrgetter("size"), reverse=True)
+
         self._calculate_hashes_parallel(
-            files=files,
+            files=pending,
             max_workers=max_workers,
             hash_func=self.calculate_full_hash,
             attr_name="full_hash",
             log_prefix="Failed to calculate full hash for",
         )
 
+    def hash_many(
+        self,
+        files: list[FileMeta],
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """複数ファイルの部分ハッシュと完全ハッシュを並列に計算する。
+
+        1ファイルにつき1つのジョブで ``compute_hashes`` を呼び出し、
+        FileMeta の ``partial_hash`` と ``full_hash`` をインプレースで更新する。
+        1ファイルでエラーが発生しても処理を継続し、警告ログのみを出力する。
+
+        Args:
+            files: ハッシュ計算対象の FileMeta リスト。
+            max_workers: ワーカースレッド数。Noneの場合は
+                ``DEFAULT_HASH_MANY_WORKERS`` を使用する。
+
+        Returns:
+            None: FileMeta.partial_hash / full_hash をインプレースで更新する。
+        """
+        if not files:
+            return
+
+        # 1ファイルだけならスレッドプールを作らずにその場で計算する
+        if len(files) == 1:
+            file_meta = files[0]
+            try:
+                file_meta.partial_hash, file_meta.full_hash = self.compute_hashes(
+                    file_meta.path
+                )
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(
+                    "Failed to calculate hashes for %s: %s", file_meta.path, exc
+                )
+            return
+
+        if max_workers is None:
+            max_workers = DEFAULT_HASH_MANY_WORKERS
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_file = {
+                executor.submit(self.compute_hashes, file_meta.path): file_meta
+                for file_meta in files
+            }
+            for future in as_completed(future_to_file):
+                file_meta = future_to_file[future]
+                try:
+                    file_meta.partial_hash, file_meta.full_hash = future.result()
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning(
+                        "Failed to calculate hashes for %s: %s", file_meta.path, exc
+                    )
+
+    def prefetch(self, paths: Iterable[Union[str, Path]]) -> None:
+        """ファイル先頭の読み込みをカーネルに予告する
+
+        ``posix_fadvise(WILLNEED)`` はブロックせずに先読みを開始させるため、
+        ハッシュ計算前に呼ぶとI/O待ちを他のファイルの計算と重ねられる。
+        ただし各ファイルを呼び出し元のスレッドで開くため、``hash_many`` からは
+        呼ばない。大量のファイルや遅いドライブでは、開く処理だけの直列な
+        走査がハッシュ計算の開始を遅らせてしまう。
+        先読みするのは各ファイルの先頭 ``PREFETCH_SIZE`` バイトまでとし、
+        大きなファイルでページキャッシュを埋め尽くさないようにする。
+        posix_fadviseがないOSや開けないファイルでは何もしない。
+
+        Args:
+            paths: 先読みするファイルパス
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+
+        for path in paths:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, PREFETCH_SIZE, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+
+    def hash_candidates(
+        self,
+        files: list[FileMeta],
+        max_workers: Optional[int] = None,
+    ) -> list[FileMeta]:
+        """同じサイズのファイルが他に存在するファイルだけをハッシュ計算する。
+
+        サイズが一意なファイルは重複し得ないため読み込まず、
+        ``partial_hash`` / ``full_hash`` は None のまま残す。
+
+        Args:
+            files: ハッシュ計算候補の FileMeta リスト。
+            max_workers: ``hash_many`` に渡すワーカースレッド数。
+
+        Returns:
+            list[FileMeta]: ハッシュ計算の対象になったファイルのリスト。
+        """
+        size_counts = Counter(file_meta.size for file_meta in files)
+        candidates = [
+            file_meta for file_meta in files if size_counts[file_meta.size] >= 2
+        ]
+        self.hash_many(candidates, max_workers=max_workers)
+        return candidates
+
+    def compute_hashes(self, file_path: Union[str, Path]) -> tuple[str, str]:
+        """1回の読み込みで部分ハッシュと完全ハッシュを計算する
+
+        ファイルを先頭から1度だけ読み込み、完全ハッシュを更新しながら
+        先頭と末尾のチャンクを保持して部分ハッシュも算出する。
+        結果は ``calculate_partial_hash`` / ``calculate_full_hash`` と一致する。
+
+        Args:
+            file_path: ファイルパス
+
+        Returns:
+            (部分ハッシュ, 完全ハッシュ) のタプル(16進数文字列)
+
+        Raises:
+            FileNotFoundError: ファイルが存在しない場合
+            OSError: ファイル読み込みエラーの場合
+        """
+        path = Path(file_path)
+
+        try:
+            stat_result = path.stat() if self.cache is not None else None
+            partial_key = self._cache_key(path, "partial", stat_result)
+            full_key = self._cache_key(path, "full", stat_result)
+            cached_partial = self._cache_lookup(partial_key)
+            cached_full = self._cache_lookup(full_key)
+            if cached_partial is not None and cached_full is not None:
+                return cached_partial, cached_full
+
+            full_hash_obj = self._get_hash_object()
+
+            with self._open_stream(path) as f:
+                buffer = self._stream_buffer()
+                view = memoryview(buffer)
+                head = bytearray()
+                tail = bytearray()
+                file_size = 0
+                while read_size := f.readinto(buffer):
+                    chunk = view[:read_size]
+                    full_hash_obj.update(chunk)
+                    file_size += read_size
+
+                    if len(head) < self.chunk_size:
+                        head += chunk[: self.chunk_size - len(head)]
+                    if read_size >= self.chunk_size:
+                        tail[:] = chunk[-self.chunk_size :]
+                    else:
+                        tail += chunk
+                        if len(tail) > self.chunk_size:
+                            del tail[: -self.chunk_size]
+
+            full_hash = self._finish_hash(full_key, full_hash_obj.hexdigest())
+            if self._partial_covers_file(file_size):
+                return self._finish_hash(partial_key, full_hash), full_hash
+
+            partial_hash_obj = self._get_hash_object()
+            partial_hash_obj.update(head)
+            partial_hash_obj.update(tail)
+            return self._finish_hash(
+                partial_key, partial_hash_obj.hexdigest()
+            ), full_hash
+
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
+        except OSError as e:
+            raise OSError(f"Failed to read file {file_path}: {e}") from e
+
+    @staticmethod
+    @contextmanager
+    def _open_stream(path: Path) -> Iterator[FileIO]:
+        """ファイル全体を1度だけ読むためにファイルを開く
+
+        対応OSでは読み込み前に順次アクセスを通知して先読みを強め、
+        読み終えたらページキャッシュの破棄を通知する。ハッシュ計算で読んだ
+        データは再利用されないため、他の処理のキャッシュを追い出さないようにする。
+        """
+        with open(path, "rb", buffering=0) as f:
+            fileno = f.fileno()
+            # 通知は助言にすぎないため、一部のFUSEやネットワークファイルシステムで
+            # 失敗しても無視し、ハッシュ計算を失敗扱いにしない
+            if hasattr(os, "posix_fadvise"):
+                try:
+                    os.posix_fadvise(fileno, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                except OSError:
+                    pass
+            try:
+                yield f
+            finally:
+                if hasattr(os, "posix_fadvise"):
+                    try:
+                        os.posix_fadvise(fileno, 0, 0, os.POSIX_FADV_DONTNEED)
+                    except OSError:
+                        pass
+
     def calculate_full_hash(self, file_path: Union[str, Path]) -> str:
         """ファイルの完全ハッシュを計算する
 
-        大きなファイルのメモリ使用量を抑えるために、チャンク単位で読み込んで
+        ``STREAM_READ_SIZE`` 以上のバッファを再利用しながら先頭から順に読み込み、
         ハッシュを計算する。
 
         Args:
@@ -245,18 +595,25 @@ class Hasher:
         """
         path = Path(file_path)
 
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
-
         try:
+            cache_key = self._cache_key(path, "full")
+            if (cached := self._cache_lookup(cache_key)) is not None:
+                return cached
+
             hash_obj = self._get_hash_object()
 
-            with open(path, "rb") as f:
-                # 大きなファイルのためにチャンクで読み込む
-                while chunk := f.read(self.chunk_size):
-                    hash_obj.update(chunk)
+            # メモリマップは読み込み中にファイルが切り詰められるとSIGBUSで
+            # プロセスごと落ちるため使わず、ファイル単位のOSErrorで済む読み込みにする
+            with self._open_stream(path) as f:
+                # チャンクごとにbytesを生成しないよう、再利用するバッファに読み込む
+                buffer = self._stream_buffer()
+                view = memoryview(buffer)
+                while read_size := f.readinto(buffer):
+                    hash_obj.update(view[:read_size])
 
-            return hash_obj.hexdigest()
+            return self._finish_hash(cache_key, hash_obj.hexdigest())
 
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
         except OSError as e:
             raise OSError(f"Failed to read file {file_path}: {e}") from e
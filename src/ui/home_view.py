@@ -2,8 +2,9 @@
 ホームビュー - フォルダ選択画面
 """
 
+import os
+import stat
 from typing import List, Optional
-from pathlib import Path
 
 import flet as ft
 
@@ -15,6 +16,7 @@ class HomeView:
         """HomeViewを初期化する"""
         self.selected_folders: List[str] = []
         self.page: Optional[ft.Page] = None
+        self._pending_flush = False
 
         # UIコンポーネント
         self.folder_list = ft.ListView(expand=True, height=200)
@@ -31,6 +33,9 @@ class HomeView:
         # File picker
         self.file_picker = ft.FilePicker(on_result=self._on_folder_picked)
 
+        # 通知用SnackBar(イベントごとに生成せず使い回す)
+        self._snack = ft.SnackBar(content=ft.Text(""), bgcolor=ft.Colors.BLUE_600)
+
     def build(self) -> ft.Column:
         """
         UIを構築する
@@ -83,9 +88,7 @@ class HomeView:
 
         if folder_path not in self.selected_folders:
             self.selected_folders.append(folder_path)
-            if self.page:
-                self._update_folder_list()
-                self._update_start_button()
+            self._schedule_folder_ui_flush()
 
     def remove_folder(self, folder_path: str) -> None:
         """
@@ -131,12 +134,30 @@ class HomeView:
             if not folder_path or folder_path.strip() == "":
                 return False
 
-            # 実際の環境では存在チェックも行う
-            path = Path(folder_path)
-            return path.exists() and path.is_dir()
+            # 存在チェックとディレクトリ判定を1回のstatで行う
+            return stat.S_ISDIR(os.stat(folder_path).st_mode)
         except (OSError, PermissionError, Exception):
             return False
 
+    def _schedule_folder_ui_flush(self) -> None:
+        """
+        フォルダリストのUI更新を次のイベントループに予約する
+
+        連続したadd_folder呼び出し(複数フォルダのドロップなど)を
+        1回のUI更新にまとめる。
+        """
+        if not self.page or self._pending_flush:
+            return
+
+        self._pending_flush = True
+        self.page.run_task(self._flush_folder_ui)
+
+    async def _flush_folder_ui(self) -> None:
+        """予約されたフォルダリストのUI更新をまとめて反映する"""
+        self._pending_flush = False
+        self.start_button.disabled = not self.can_start_scan()
+        self._update_folder_list()
+
     def _update_folder_list(self) -> None:
         """フォルダリストのUIを更新する"""
         if not self.page:
@@ -149,13 +170,32 @@ class HomeView:
                 leading=ft.Icon(ft.Icons.FOLDER),
                 title=ft.Text(folder),
                 trailing=ft.IconButton(
-                    ft.Icons.DELETE, on_click=lambda _, f=folder: self.remove_folder(f)
+                    ft.Icons.DELETE,
+                    on_click=self._on_remove_folder_clicked,
+                    data=folder,
                 ),
             )
             self.folder_list.controls.append(folder_item)
 
         self.page.update()
 
+    def _show_snack(self, message: str, color: ft.ColorValue) -> None:
+        """
+        共有のSnackBarでメッセージを表示する
+
+        Args:
+            message: 表示するメッセージ
+            color: SnackBarの背景色
+        """
+        if not self.page:
+            return
+
+        self._snack.content.value = message
+        self._snack.bgcolor = color
+        self.page.snack_bar = self._snack
+        self._snack.open = True
+        self.page.update()
+
     def _update_start_button(self) -> None:
         """Start Scanボタンの状態を更新する"""
         self.start_button.disabled = not self.can_start_scan()
@@ -172,6 +212,10 @@ class HomeView:
         if e.path:
             self.add_folder(e.path)
 
+    def _on_remove_folder_clicked(self, e: ft.ControlEvent) -> None:
+        """フォルダの削除ボタンがクリックされたときの処理(全ボタンで共有)"""
+        self.remove_folder(e.control.data)
+
     def _on_clear_clicked(self, e: ft.ControlEvent) -> None:
         """Clear Allボタンがクリックされたときの処理"""
         self.clear_folders()
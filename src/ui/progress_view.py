@@ -6,6 +6,9 @@ from typing import Callable, Optional
 
 import flet as ft
 
+# プログレスバーの値を丸める小数点以下の桁数(表示上区別できない変化は無視する)
+PROGRESS_PRECISION = 3
+
 
 class ProgressView:
     """プログレスビューコントロール"""
@@ -58,15 +61,25 @@ class ProgressView:
             current: 現在の進捗数
             total: 合計数
         """
-        self.stage_label.value = stage
-
         if total > 0:
             progress_ratio = current / total
-            self.progress_bar.value = max(0.0, min(1.0, progress_ratio))
-            self.count_label.value = f"{current}/{total}"
+            bar_value = round(max(0.0, min(1.0, progress_ratio)), PROGRESS_PRECISION)
+            count_text = f"{current}/{total}"
         else:
-            self.progress_bar.value = 0.0
-            self.count_label.value = "0/0"
+            bar_value = 0.0
+            count_text = "0/0"
+
+        # 表示が変わらない場合はFletへの更新送信を省略する
+        if (
+            self.stage_label.value == stage
+            and self.count_label.value == count_text
+            and self.progress_bar.value == bar_value
+        ):
+            return
+
+        self.stage_label.value = stage
+        self.progress_bar.value = bar_value
+        self.count_label.value = count_text
 
         if self.page:
             self.page.update()
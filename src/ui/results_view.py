@@ -2,6 +2,8 @@
 結果ビュー - 重複ファイルのリストと選択インターフェース
 """
 
+import asyncio
+from functools import partial
 from typing import Callable, Dict, List, Optional, Set
 
 import flet as ft
@@ -9,6 +11,9 @@ import flet as ft
 from ..models.file_meta import FileMeta
 from ..models.duplicate_group import DuplicateGroup
 
+# 非同期描画時に1回のpage.update()で追加するグループカード数
+GROUP_RENDER_CHUNK_SIZE = 50
+
 
 class ResultsView:
     """結果ビューコントロール"""
@@ -16,10 +21,13 @@ class ResultsView:
     def __init__(self) -> None:
         """ResultsViewを初期化する"""
         self.duplicate_groups: List[DuplicateGroup] = []
-        self.selected_files: Set[FileMeta] = set()
-        self.file_checkboxes: Dict[FileMeta, ft.Checkbox] = {}
+        # FileMetaのハッシュ計算を避けるため、id(file)をキーとして管理する
+        self.selected_files: Set[int] = set()
+        self.file_checkboxes: Dict[int, ft.Checkbox] = {}
+        self._files_by_id: Dict[int, FileMeta] = {}
         self.page: Optional[ft.Page] = None
         self.delete_callback: Optional[Callable[[List[FileMeta]], None]] = None
+        self._render_generation = 0
 
         # UIコンポーネント
         self.groups_column = ft.Column(spacing=10, scroll=ft.ScrollMode.AUTO)
@@ -69,9 +77,20 @@ class ResultsView:
             groups: 重複グループのリスト
         """
         self.duplicate_groups = groups
-        self._update_groups_list()
-        if self.page:
-            self.page.update()
+        self._render_generation += 1
+
+        if not self.page:
+            self._update_groups_list()
+            return
+
+        # 大量のカード構築でUIが固まらないよう、カードは非同期で段階的に追加する
+        has_groups = self._reset_groups_list()
+        self.page.update()
+        if has_groups:
+            # 世代は実行時ではなく予約時に確定させ、古いタスクを確実に中断させる
+            self.page.run_task(
+                partial(self._update_groups_list_async, self._render_generation)
+            )
 
     def toggle_file_selection(self, file: FileMeta) -> None:
         """
@@ -81,10 +100,12 @@ class ResultsView:
             file: 選択状態を切り替えるファイル
         """
         # 選択状態を切り替え
-        if file in self.selected_files:
-            self.selected_files.remove(file)
+        file_id = id(file)
+        self._files_by_id[file_id] = file
+        if file_id in self.selected_files:
+            self.selected_files.remove(file_id)
         else:
-            self.selected_files.add(file)
+            self.selected_files.add(file_id)
 
         # UI更新（バッチ処理で複数回のupdateを避ける）
         self._update_delete_button()
@@ -100,7 +121,7 @@ class ResultsView:
         Returns:
             List[FileMeta]: 選択されたファイルのリスト
         """
-        return list(self.selected_files)
+        return [self._files_by_id[file_id] for file_id in self.selected_files]
 
     def clear_selection(self) -> None:
         """選択をクリアする"""
@@ -125,10 +146,16 @@ class ResultsView:
         """
         self.delete_callback = callback
 
-    def _update_groups_list(self) -> None:
-        """重複グループリストのUIを更新する"""
+    def _reset_groups_list(self) -> bool:
+        """
+        重複グループリストのUIと選択状態をリセットする
+
+        Returns:
+            bool: 表示すべき重複グループがあればTrue
+        """
         self.groups_column.controls.clear()
         self.file_checkboxes.clear()
+        self._files_by_id.clear()
         self.selected_files.clear()
         self._update_delete_button()
 
@@ -136,12 +163,40 @@ class ResultsView:
             self.groups_column.controls.append(
                 ft.Text("No duplicate files found", size=16, italic=True)
             )
+            return False
+        return True
+
+    def _update_groups_list(self) -> None:
+        """重複グループリストのUIを同期的に更新する"""
+        if not self._reset_groups_list():
             return
 
         for group in self.duplicate_groups:
             group_item = self._create_group_item(group)
             self.groups_column.controls.append(group_item)
 
+    async def _update_groups_list_async(self, generation: int) -> None:
+        """
+        重複グループのカードをチャンク単位で追加し、合間にイベントループへ制御を返す
+
+        描画中や実行開始前に新しいグループが設定された場合は、古い描画を中断する。
+
+        Args:
+            generation: タスクを予約したときの描画世代
+        """
+        for index, group in enumerate(self.duplicate_groups):
+            if generation != self._render_generation:
+                return
+
+            self.groups_column.controls.append(self._create_group_item(group))
+            if index % GROUP_RENDER_CHUNK_SIZE == GROUP_RENDER_CHUNK_SIZE - 1:
+                if self.page:
+                    self.page.update()
+                await asyncio.sleep(0)
+
+        if self.page and generation == self._render_generation:
+            self.page.update()
+
     def _create_group_item(self, group: DuplicateGroup) -> ft.Card:
         """
         重複グループのUIアイテムを作成する
@@ -190,11 +245,14 @@ class ResultsView:
         Returns:
             ft.ListTile: ファイルのUIアイテム
         """
+        file_id = id(file)
         checkbox = ft.Checkbox(
-            value=file in self.selected_files,
-            on_change=lambda _, f=file: self.toggle_file_selection(f),
+            value=file_id in self.selected_files,
+            on_change=self._on_checkbox_change,
+            data=file_id,
         )
-        self.file_checkboxes[file] = checkbox
+        self.file_checkboxes[file_id] = checkbox
+        self._files_by_id[file_id] = file
 
         return ft.ListTile(
             leading=checkbox,
@@ -219,11 +277,12 @@ class ResultsView:
 
     def _update_file_checkbox(self, file: FileMeta) -> None:
         """特定ファイルのチェックボックス状態を更新する"""
-        checkbox = self.file_checkboxes.get(file)
+        file_id = id(file)
+        checkbox = self.file_checkboxes.get(file_id)
         if not checkbox:
             return
 
-        is_selected = file in self.selected_files
+        is_selected = file_id in self.selected_files
         if checkbox.value != is_selected:
             checkbox.value = is_selected
             if getattr(checkbox, "page", None):
@@ -231,8 +290,8 @@ class ResultsView:
 
     def _update_all_checkboxes(self) -> None:
         """すべてのチェックボックス状態を更新する"""
-        for file, checkbox in self.file_checkboxes.items():
-            is_selected = file in self.selected_files
+        for file_id, checkbox in self.file_checkboxes.items():
+            is_selected = file_id in self.selected_files
             if checkbox.value != is_selected:
                 checkbox.value = is_selected
                 if getattr(checkbox, "page", None):
@@ -257,6 +316,12 @@ class ResultsView:
         else:
             return f"{size_bytes} B"
 
+    def _on_checkbox_change(self, e: ft.ControlEvent) -> None:
+        """チェックボックスが変更されたときの処理(全チェックボックスで共有)"""
+        file = self._files_by_id.get(e.control.data)
+        if file is not None:
+            self.toggle_file_selection(file)
+
     def _on_delete_clicked(self, e: Optional[ft.ControlEvent]) -> None:
         """削除ボタンがクリックされたときの処理"""
         selected_files = self.get_selected_files()
@@ -1,5 +1,8 @@
 """Shared fixtures and helpers for integration tests."""
 
+import copy
+import shutil
+import sys
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -10,45 +13,98 @@ import pytest
 from src.models.file_meta import FileMeta
 from src.services.deleter import Deleter
 from src.services.detector import DuplicateDetector
+from src.services.hash_cache import HashCache
 from src.services.hasher import Hasher
 
 
-@pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
-    """Create a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+# RAM-backed tmpfs on Linux; keeps the write-then-hash tests off the block layer.
+SHM_DIR = Path("/dev/shm")  # noqa: S108 - only used as mkdtemp parent
+
+
+@pytest.fixture(scope="session")
+def temp_root(
+    tmp_path_factory: pytest.TempPathFactory, worker_id: str
+) -> Generator[Path, None, None]:
+    """Create one base directory per worker session, in tmpfs when available."""
+    if sys.platform != "linux" or not SHM_DIR.is_dir():
+        yield tmp_path_factory.mktemp(f"dupe_{worker_id}")
+        return
+
+    path = Path(tempfile.mkdtemp(prefix=f"dupe_{worker_id}_", dir=SHM_DIR))
+    try:
+        yield path
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
 
 
 @pytest.fixture
+def temp_dir(temp_root: Path, request: pytest.FixtureRequest) -> Path:
+    """Create an isolated per-test directory inside the session base directory."""
+    return Path(tempfile.mkdtemp(prefix=f"{request.node.name}_", dir=temp_root))
+
+
+@pytest.fixture(scope="session")
 def hasher() -> Hasher:
-    """Create a Hasher instance."""
-    return Hasher()
+    """Create a Hasher shared by the session, memoizing hashes per file state.
 
+    The in-memory cache is keyed by resolved path, size and st_mtime_ns, so a
+    file hashed again (e.g. to cross-check hash_many) is not re-read.
+    """
+    return Hasher(cache=HashCache())
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def detector() -> DuplicateDetector:
-    """Create a DuplicateDetector instance."""
+    """Create a stateless DuplicateDetector instance shared by the session."""
     return DuplicateDetector()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def deleter() -> Deleter:
-    """Create a Deleter instance."""
+    """Create a stateless Deleter instance shared by the session."""
     return Deleter()
 
 
+def _write_file_meta(path: Path, content: bytes) -> FileMeta:
+    """Write content to path and return its FileMeta."""
+    path.write_bytes(content)
+    stat = path.stat()
+    return FileMeta(
+        path=str(path),
+        size=stat.st_size,
+        modified_time=datetime.fromtimestamp(stat.st_mtime),
+    )
+
+
 @pytest.fixture
 def _create_test_file() -> Callable[[Path, bytes], FileMeta]:
     """Return helper for creating a test file and its FileMeta."""
+    return _write_file_meta
+
+
+@pytest.fixture(scope="session")
+def duplicate_pair_factory(
+    temp_root: Path, hasher: Hasher
+) -> Callable[..., list[FileMeta]]:
+    """Return a factory of pre-hashed files that share the same content.
+
+    ``make(content, n=2)`` writes ``file1.bin`` .. ``file{n}.bin`` once per
+    ``(content, n)`` for the whole session and hashes them. Later calls return
+    fresh copies of the cached FileMeta objects, so tests can mutate them freely
+    while the files on disk stay shared.
+    """
+    cache: dict[tuple[bytes, int], list[FileMeta]] = {}
 
-    def _create(path: Path, content: bytes) -> FileMeta:
-        path.write_bytes(content)
-        stat = path.stat()
-        return FileMeta(
-            path=str(path),
-            size=stat.st_size,
-            modified_time=datetime.fromtimestamp(stat.st_mtime),
-        )
+    def _make(content: bytes, n: int = 2) -> list[FileMeta]:
+        key = (content, n)
+        if key not in cache:
+            directory = Path(tempfile.mkdtemp(prefix="duplicates_", dir=temp_root))
+            files = [
+                _write_file_meta(directory / f"file{i}.bin", content)
+                for i in range(1, n + 1)
+            ]
+            hasher.hash_many(files)
+            cache[key] = files
+        return [copy.copy(file_meta) for file_meta in cache[key]]
 
-    return _create
+    return _make
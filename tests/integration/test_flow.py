@@ -6,7 +6,6 @@ to verify the entire application flow works correctly.
 
 from datetime import datetime
 from pathlib import Path
-from typing import List
 from unittest.mock import patch
 
 import pytest
@@ -34,8 +33,8 @@ class TestHasherDetectorIntegration:
         Then: Correct duplicate groups are identified
         """
         # Given: Create test files - 2 duplicates and 1 unique
-        content_a = b"This is duplicate content A" * 100
-        content_b = b"This is unique content B" * 100
+        content_a = b"A"
+        content_b = b"B"
 
         file1 = _create_test_file(temp_dir / "file1.txt", content_a)
         file2 = _create_test_file(temp_dir / "file2.txt", content_a)
@@ -44,9 +43,7 @@ class TestHasherDetectorIntegration:
 
         # When: Calculate hashes for all files
         files = [file1, file2, file3]
-        for f in files:
-            f.partial_hash = hasher.calculate_partial_hash(f.path)
-            f.full_hash = hasher.calculate_full_hash(f.path)
+        hasher.hash_many(files)
 
         # Then: Detect duplicates
         duplicates = detector.find_duplicates(files)
@@ -72,9 +69,9 @@ class TestHasherDetectorIntegration:
         Then: All duplicate groups are correctly identified
         """
         # Given: Create multiple duplicate groups
-        content_a = b"Group A content" * 100
-        content_b = b"Group B content" * 100
-        content_c = b"Unique content" * 100
+        content_a = b"A"
+        content_b = b"B"
+        content_c = b"C"
 
         # Group A: 2 duplicates
         file_a1 = _create_test_file(temp_dir / "a1.txt", content_a)
@@ -90,9 +87,7 @@ class TestHasherDetectorIntegration:
 
         # When: Hash all files
         files = [file_a1, file_a2, file_b1, file_b2, file_b3, file_c]
-        for f in files:
-            f.partial_hash = hasher.calculate_partial_hash(f.path)
-            f.full_hash = hasher.calculate_full_hash(f.path)
+        hasher.hash_many(files)
 
         # Then: Detect duplicates
         duplicates = detector.find_duplicates(files)
@@ -118,15 +113,13 @@ class TestHasherDetectorIntegration:
         Then: No duplicate groups are found
         """
         # Given: Create files with unique content
-        file1 = _create_test_file(temp_dir / "file1.txt", b"Content 1" * 100)
-        file2 = _create_test_file(temp_dir / "file2.txt", b"Content 2" * 100)
-        file3 = _create_test_file(temp_dir / "file3.txt", b"Content 3" * 100)
+        file1 = _create_test_file(temp_dir / "file1.txt", b"1")
+        file2 = _create_test_file(temp_dir / "file2.txt", b"2")
+        file3 = _create_test_file(temp_dir / "file3.txt", b"3")
 
         # When: Hash all files
         files = [file1, file2, file3]
-        for f in files:
-            f.partial_hash = hasher.calculate_partial_hash(f.path)
-            f.full_hash = hasher.calculate_full_hash(f.path)
+        hasher.hash_many(files)
 
         # Then: No duplicates
         duplicates = detector.find_duplicates(files)
@@ -146,9 +139,9 @@ class TestHasherDetectorIntegration:
         Then: No duplicate groups are found
         """
         # Given: Create files with same size but different content
-        content1 = b"A" * 1000
-        content2 = b"B" * 1000
-        content3 = b"C" * 1000
+        content1 = b"A"
+        content2 = b"B"
+        content3 = b"C"
 
         file1 = _create_test_file(temp_dir / "file1.txt", content1)
         file2 = _create_test_file(temp_dir / "file2.txt", content2)
@@ -159,9 +152,7 @@ class TestHasherDetectorIntegration:
 
         # When: Hash all files
         files = [file1, file2, file3]
-        for f in files:
-            f.partial_hash = hasher.calculate_partial_hash(f.path)
-            f.full_hash = hasher.calculate_full_hash(f.path)
+        hasher.hash_many(files)
 
         # Then: No duplicates (different hashes)
         duplicates = detector.find_duplicates(files)
@@ -186,7 +177,7 @@ class TestFullWorkflowIntegration:
         Then: Duplicates are correctly identified and deleted
         """
         # Given: Create duplicate files
-        content = b"Duplicate content for deletion test" * 100
+        content = b"D"
 
         original = _create_test_file(temp_dir / "original.txt", content)
         duplicate1 = _create_test_file(temp_dir / "duplicate1.txt", content)
@@ -194,9 +185,7 @@ class TestFullWorkflowIntegration:
 
         # When: Hash files
         files = [original, duplicate1, duplicate2]
-        for f in files:
-            f.partial_hash = hasher.calculate_partial_hash(f.path)
-            f.full_hash = hasher.calculate_full_hash(f.path)
+        hasher.hash_many(files)
 
         # Detect duplicates
         duplicates = detector.find_duplicates(files)
@@ -204,7 +193,8 @@ class TestFullWorkflowIntegration:
         assert len(duplicates[0].files) == 3
 
         # Select files to delete (keep original, delete duplicates)
-        files_to_delete = [f for f in duplicates[0].files if "duplicate" in f.path]
+        targets = {duplicate1.path, duplicate2.path}
+        files_to_delete = [f for f in duplicates[0].files if f.path in targets]
         assert len(files_to_delete) == 2
 
         # Delete with mocked send2trash
@@ -232,24 +222,25 @@ class TestFullWorkflowIntegration:
         Then: Progress callback is called for each file
         """
         # Given: Create duplicate files
-        content = b"Test content" * 100
+        content = b"T"
         file1 = _create_test_file(temp_dir / "file1.txt", content)
         file2 = _create_test_file(temp_dir / "file2.txt", content)
 
         # Hash files
-        for f in [file1, file2]:
-            f.partial_hash = hasher.calculate_partial_hash(f.path)
-            f.full_hash = hasher.calculate_full_hash(f.path)
+        hasher.hash_many([file1, file2])
 
         # Detect duplicates
         duplicates = detector.find_duplicates([file1, file2])
         assert len(duplicates) == 1
 
         # Setup progress callback
-        progress_calls: List[tuple] = []
+        progress_count = 0
+        last_call: tuple[str, int, int] | None = None
 
         def progress_callback(path: str, current: int, total: int) -> None:
-            progress_calls.append((path, current, total))
+            nonlocal progress_count, last_call
+            progress_count += 1
+            last_call = (path, current, total)
 
         # When: Delete with progress callback
         files_to_delete = [duplicates[0].files[0]]  # Delete one file
@@ -261,9 +252,8 @@ class TestFullWorkflowIntegration:
             )
 
         # Then: Progress callback was called
-        assert len(progress_calls) == 1
-        assert progress_calls[0][1] == 1  # current
-        assert progress_calls[0][2] == 1  # total
+        assert progress_count == 1
+        assert last_call == (files_to_delete[0].path, 1, 1)  # path, current, total
 
     def test_workflow_handles_deletion_errors(
         self,
@@ -280,14 +270,12 @@ class TestFullWorkflowIntegration:
         Then: Errors are recorded and other files are still processed
         """
         # Given: Create files
-        content = b"Test content" * 100
+        content = b"T"
         file1 = _create_test_file(temp_dir / "file1.txt", content)
         file2 = _create_test_file(temp_dir / "file2.txt", content)
 
         # Hash files
-        for f in [file1, file2]:
-            f.partial_hash = hasher.calculate_partial_hash(f.path)
-            f.full_hash = hasher.calculate_full_hash(f.path)
+        hasher.hash_many([file1, file2])
 
         # Detect duplicates
         duplicates = detector.find_duplicates([file1, file2])
@@ -311,6 +299,16 @@ class TestFullWorkflowIntegration:
         assert "file1" in result.failed_files[0][0]
 
 
+def _make_pattern(parts: list[tuple[bytes, int]]) -> bytes:
+    """Build content from (byte, count) runs using a single preallocated buffer."""
+    buffer = bytearray(sum(count for _, count in parts))
+    offset = 0
+    for byte, count in parts:
+        buffer[offset : offset + count] = byte * count
+        offset += count
+    return bytes(buffer)
+
+
 class TestLargeFileHandling:
     """Integration tests for handling large files efficiently."""
 
@@ -330,7 +328,7 @@ class TestLargeFileHandling:
         """
         # Given: Create large duplicate files (16KB each)
         # 16KB = 4KB + 8KB + 4KB
-        large_content = b"A" * 4096 + b"B" * 8192 + b"C" * 4096
+        large_content = _make_pattern([(b"A", 4096), (b"B", 8192), (b"C", 4096)])
 
         file1 = _create_test_file(temp_dir / "large1.bin", large_content)
         # duplicate of file1
@@ -338,9 +336,7 @@ class TestLargeFileHandling:
 
         # When: Hash files
         files = [file1, file2]
-        for f in files:
-            f.partial_hash = hasher.calculate_partial_hash(f.path)
-            f.full_hash = hasher.calculate_full_hash(f.path)
+        hasher.hash_many(files)
 
         # Verify partial hashes match
         assert file1.partial_hash == file2.partial_hash
@@ -364,22 +360,15 @@ class TestLargeFileHandling:
         Then: Files are not grouped as duplicates
         """
         # Given: Files with same first/last 4KB but different middle
-        start = b"S" * 4096
-        end = b"E" * 4096
-        middle1 = b"M" * 8192
-        middle2 = b"N" * 8192
-
-        content1 = start + middle1 + end
-        content2 = start + middle2 + end
+        content1 = _make_pattern([(b"S", 4096), (b"M", 8192), (b"E", 4096)])
+        content2 = _make_pattern([(b"S", 4096), (b"N", 8192), (b"E", 4096)])
 
         file1 = _create_test_file(temp_dir / "file1.bin", content1)
         file2 = _create_test_file(temp_dir / "file2.bin", content2)
 
         # When: Hash files
         files = [file1, file2]
-        for f in files:
-            f.partial_hash = hasher.calculate_partial_hash(f.path)
-            f.full_hash = hasher.calculate_full_hash(f.path)
+        hasher.hash_many(files)
 
         # Partial hashes should match (same start/end)
         assert file1.partial_hash == file2.partial_hash
@@ -413,9 +402,7 @@ class TestEdgeCases:
 
         # When: Hash files
         files = [file1, file2]
-        for f in files:
-            f.partial_hash = hasher.calculate_partial_hash(f.path)
-            f.full_hash = hasher.calculate_full_hash(f.path)
+        hasher.hash_many(files)
 
         # Then: Empty files are duplicates
         duplicates = detector.find_duplicates(files)
@@ -442,9 +429,7 @@ class TestEdgeCases:
 
         # When: Hash files
         files = [file1, file2, file3]
-        for f in files:
-            f.partial_hash = hasher.calculate_partial_hash(f.path)
-            f.full_hash = hasher.calculate_full_hash(f.path)
+        hasher.hash_many(files)
 
         # Then: Only matching files are duplicates
         duplicates = detector.find_duplicates(files)
@@ -504,11 +489,13 @@ class TestEdgeCases:
         # Large unique
         large = _create_test_file(temp_dir / "large.txt", large_content)
 
-        # When: Hash all files
+        # When: Hash only files that share a size with another file
         files = [small1, small2, medium, large]
-        for f in files:
-            f.partial_hash = hasher.calculate_partial_hash(f.path)
-            f.full_hash = hasher.calculate_full_hash(f.path)
+        candidates = hasher.hash_candidates(files)
+
+        # Unique sizes are never read
+        assert candidates == [small1, small2]
+        assert medium.partial_hash is None and large.full_hash is None
 
         # Then: Only small files are duplicates
         duplicates = detector.find_duplicates(files)
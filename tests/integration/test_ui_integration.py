@@ -4,18 +4,33 @@ Tests the integration of UI views with backend services
 to verify the complete user workflow.
 """
 
-from pathlib import Path
-from unittest.mock import patch
+from datetime import datetime
+from unittest.mock import MagicMock
 
 import pytest
 
+from src.models.duplicate_group import DuplicateGroup
+from src.models.file_meta import FileMeta
 from src.services.deleter import DeleteResult, Deleter
 from src.services.detector import DuplicateDetector
-from src.services.hasher import Hasher
 from src.ui.cleanup_view import CleanupView
 from src.ui.results_view import ResultsView
 
 
+def _in_memory_file(name: str, content_hash: str) -> FileMeta:
+    """Build a pre-hashed FileMeta without touching the filesystem.
+
+    For tests whose subject is view state rather than hashing or deletion.
+    """
+    return FileMeta(
+        path=f"/fake/{name}",
+        size=1200,
+        modified_time=datetime(2024, 1, 1),
+        partial_hash=content_hash,
+        full_hash=content_hash,
+    )
+
+
 class TestResultsViewWithServices:
     """Integration tests for ResultsView with backend services."""
 
@@ -24,13 +39,21 @@ class TestResultsViewWithServices:
         """Create a ResultsView instance."""
         return ResultsView()
 
-    def test_results_view_displays_detected_duplicates(
+    @pytest.fixture
+    def loaded_results_view(
         self,
-        temp_dir: Path,
-        hasher: Hasher,
         detector: DuplicateDetector,
         results_view: ResultsView,
-        _create_test_file,
+    ) -> tuple[ResultsView, list[DuplicateGroup]]:
+        """Return a ResultsView loaded with duplicates of in-memory files."""
+        duplicates = detector.find_duplicates(
+            [_in_memory_file("file1.txt", "same"), _in_memory_file("file2.txt", "same")]
+        )
+        results_view.set_duplicate_groups(duplicates)
+        return results_view, duplicates
+
+    def test_results_view_displays_detected_duplicates(
+        self, loaded_results_view: tuple[ResultsView, list[DuplicateGroup]]
     ) -> None:
         """Test ResultsView correctly displays detected duplicates.
 
@@ -38,31 +61,15 @@ class TestResultsViewWithServices:
         When: Setting duplicate groups on ResultsView
         Then: View correctly displays the groups
         """
-        # Given: Create and detect duplicates
-        content = b"Duplicate content" * 100
-        file1 = _create_test_file(temp_dir / "file1.txt", content)
-        file2 = _create_test_file(temp_dir / "file2.txt", content)
-
-        for f in [file1, file2]:
-            f.partial_hash = hasher.calculate_partial_hash(f.path)
-            f.full_hash = hasher.calculate_full_hash(f.path)
-
-        duplicates = detector.find_duplicates([file1, file2])
-
-        # When: Set duplicates on view
-        results_view.set_duplicate_groups(duplicates)
+        # Given / When: Duplicates detected and set on the view
+        results_view, _ = loaded_results_view
 
         # Then: View has the correct data
         assert len(results_view.duplicate_groups) == 1
         assert len(results_view.duplicate_groups[0].files) == 2
 
     def test_results_view_file_selection(
-        self,
-        temp_dir: Path,
-        hasher: Hasher,
-        detector: DuplicateDetector,
-        results_view: ResultsView,
-        _create_test_file,
+        self, loaded_results_view: tuple[ResultsView, list[DuplicateGroup]]
     ) -> None:
         """Test file selection in ResultsView.
 
@@ -70,17 +77,8 @@ class TestResultsViewWithServices:
         When: Selecting files for deletion
         Then: Selected files are tracked correctly
         """
-        # Given: Create and detect duplicates
-        content = b"Test content" * 100
-        file1 = _create_test_file(temp_dir / "file1.txt", content)
-        file2 = _create_test_file(temp_dir / "file2.txt", content)
-
-        for f in [file1, file2]:
-            f.partial_hash = hasher.calculate_partial_hash(f.path)
-            f.full_hash = hasher.calculate_full_hash(f.path)
-
-        duplicates = detector.find_duplicates([file1, file2])
-        results_view.set_duplicate_groups(duplicates)
+        # Given: Duplicates displayed in the view
+        results_view, duplicates = loaded_results_view
 
         # When: Select a file
         file_to_select = duplicates[0].files[0]
@@ -92,12 +90,7 @@ class TestResultsViewWithServices:
         assert file_to_select in selected
 
     def test_results_view_clear_selection(
-        self,
-        temp_dir: Path,
-        hasher: Hasher,
-        detector: DuplicateDetector,
-        results_view: ResultsView,
-        _create_test_file,
+        self, loaded_results_view: tuple[ResultsView, list[DuplicateGroup]]
     ) -> None:
         """Test clearing selection in ResultsView.
 
@@ -105,19 +98,8 @@ class TestResultsViewWithServices:
         When: Clearing selection
         Then: No files are selected
         """
-        # Given: Create duplicates and select files
-        content = b"Test content" * 100
-        file1 = _create_test_file(temp_dir / "file1.txt", content)
-        file2 = _create_test_file(temp_dir / "file2.txt", content)
-
-        for f in [file1, file2]:
-            f.partial_hash = hasher.calculate_partial_hash(f.path)
-            f.full_hash = hasher.calculate_full_hash(f.path)
-
-        duplicates = detector.find_duplicates([file1, file2])
-        results_view.set_duplicate_groups(duplicates)
-
-        # Select both files
+        # Given: Both duplicates selected
+        results_view, duplicates = loaded_results_view
         for file in duplicates[0].files:
             results_view.toggle_file_selection(file)
 
@@ -138,11 +120,6 @@ class TestCleanupViewWithDeleter:
         """Create a CleanupView instance."""
         return CleanupView()
 
-    @pytest.fixture
-    def deleter(self) -> Deleter:
-        """Create a Deleter instance."""
-        return Deleter()
-
     def test_cleanup_view_displays_delete_results(
         self, cleanup_view: CleanupView
     ) -> None:
@@ -224,10 +201,19 @@ class TestCleanupViewWithDeleter:
 class TestEndToEndWorkflow:
     """End-to-end tests simulating complete user workflows."""
 
+    @pytest.fixture
+    def mock_send2trash(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        """Replace send2trash in the deleter with a mock for the test."""
+        mock = MagicMock()
+        monkeypatch.setattr("src.services.deleter.send2trash", mock)
+        return mock
+
     def test_complete_user_workflow(
         self,
-        temp_dir: Path,
-        _create_test_file,
+        detector: DuplicateDetector,
+        deleter: Deleter,
+        duplicate_pair_factory,
+        mock_send2trash: MagicMock,
     ) -> None:
         """Test complete user workflow from scan to cleanup.
 
@@ -235,24 +221,13 @@ class TestEndToEndWorkflow:
         When: User scans, selects, and deletes duplicates
         Then: Workflow completes successfully
         """
-        # Setup: Create services and views
-        hasher = Hasher()
-        detector = DuplicateDetector()
-        deleter = Deleter()
+        # Setup: Create views
         results_view = ResultsView()
         cleanup_view = CleanupView()
 
-        # Step 1: Create test files (simulating scan)
-        content = b"Duplicate content for E2E test" * 100
-        original = _create_test_file(temp_dir / "original.txt", content)
-        dup1 = _create_test_file(temp_dir / "duplicate1.txt", content)
-        dup2 = _create_test_file(temp_dir / "duplicate2.txt", content)
-
-        # Step 2: Hash files
-        files = [original, dup1, dup2]
-        for f in files:
-            f.partial_hash = hasher.calculate_partial_hash(f.path)
-            f.full_hash = hasher.calculate_full_hash(f.path)
+        # Step 1-2: Create and hash test files (simulating scan)
+        files = duplicate_pair_factory(b"E", n=3)
+        original, dup1, dup2 = files
 
         # Step 3: Detect duplicates
         duplicates = detector.find_duplicates(files)
@@ -263,20 +238,20 @@ class TestEndToEndWorkflow:
         assert len(results_view.duplicate_groups) == 1
 
         # Step 5: User selects files to delete (keep original)
+        targets = {dup1.path, dup2.path}
         for file in duplicates[0].files:
-            if "duplicate" in file.path:
+            if file.path in targets:
                 results_view.toggle_file_selection(file)
 
         selected = results_view.get_selected_files()
         assert len(selected) == 2, "Should have 2 files selected"
 
         # Step 6: Delete selected files
-        with patch("src.services.deleter.send2trash") as mock_trash:
-            result = deleter.delete_files(selected)
+        result = deleter.delete_files(selected)
 
-            assert result.total_deleted == 2
-            assert result.total_failed == 0
-            assert mock_trash.call_count == 2
+        assert result.total_deleted == 2
+        assert result.total_failed == 0
+        assert mock_send2trash.call_count == 2
 
         # Step 7: Display results in CleanupView
         cleanup_view.set_result(result)
@@ -284,8 +259,10 @@ class TestEndToEndWorkflow:
 
     def test_workflow_with_partial_failures(
         self,
-        temp_dir: Path,
-        _create_test_file,
+        detector: DuplicateDetector,
+        deleter: Deleter,
+        duplicate_pair_factory,
+        mock_send2trash: MagicMock,
     ) -> None:
         """Test workflow handles partial deletion failures.
 
@@ -294,30 +271,21 @@ class TestEndToEndWorkflow:
         Then: Failures are reported correctly
         """
         # Setup
-        hasher = Hasher()
-        detector = DuplicateDetector()
-        deleter = Deleter()
         cleanup_view = CleanupView()
 
         # Create test files
-        content = b"Test content" * 100
-        file1 = _create_test_file(temp_dir / "file1.txt", content)
-        file2 = _create_test_file(temp_dir / "file2.txt", content)
-
-        for f in [file1, file2]:
-            f.partial_hash = hasher.calculate_partial_hash(f.path)
-            f.full_hash = hasher.calculate_full_hash(f.path)
+        file1, file2 = duplicate_pair_factory(b"T")
 
         duplicates = detector.find_duplicates([file1, file2])
         files_to_delete = duplicates[0].files
 
         # Simulate partial failure
-        def mock_send2trash(path: str) -> None:
-            if "file1" in path:
+        def fail_for_file1(path: str) -> None:
+            if path == file1.path:
                 raise PermissionError("File locked")
 
-        with patch("src.services.deleter.send2trash", side_effect=mock_send2trash):
-            result = deleter.delete_files(files_to_delete)
+        mock_send2trash.side_effect = fail_for_file1
+        result = deleter.delete_files(files_to_delete)
 
         # Verify results
         assert result.total_deleted == 1
@@ -330,8 +298,7 @@ class TestEndToEndWorkflow:
 
     def test_workflow_empty_selection(
         self,
-        temp_dir: Path,
-        _create_test_file,
+        detector: DuplicateDetector,
     ) -> None:
         """Test workflow with no files selected.
 
@@ -340,18 +307,11 @@ class TestEndToEndWorkflow:
         Then: Delete button should be disabled
         """
         # Setup
-        hasher = Hasher()
-        detector = DuplicateDetector()
         results_view = ResultsView()
 
         # Create and detect duplicates
-        content = b"Test content" * 100
-        file1 = _create_test_file(temp_dir / "file1.txt", content)
-        file2 = _create_test_file(temp_dir / "file2.txt", content)
-
-        for f in [file1, file2]:
-            f.partial_hash = hasher.calculate_partial_hash(f.path)
-            f.full_hash = hasher.calculate_full_hash(f.path)
+        file1 = _in_memory_file("file1.txt", "same")
+        file2 = _in_memory_file("file2.txt", "same")
 
         duplicates = detector.find_duplicates([file1, file2])
         results_view.set_duplicate_groups(duplicates)
@@ -362,8 +322,7 @@ class TestEndToEndWorkflow:
 
     def test_workflow_no_duplicates_found(
         self,
-        temp_dir: Path,
-        _create_test_file,
+        detector: DuplicateDetector,
     ) -> None:
         """Test workflow when no duplicates are found.
 
@@ -372,18 +331,12 @@ class TestEndToEndWorkflow:
         Then: No duplicate groups are returned
         """
         # Setup
-        hasher = Hasher()
-        detector = DuplicateDetector()
         results_view = ResultsView()
 
         # Create unique files
-        file1 = _create_test_file(temp_dir / "file1.txt", b"Content 1" * 100)
-        file2 = _create_test_file(temp_dir / "file2.txt", b"Content 2" * 100)
-        file3 = _create_test_file(temp_dir / "file3.txt", b"Content 3" * 100)
-
-        for f in [file1, file2, file3]:
-            f.partial_hash = hasher.calculate_partial_hash(f.path)
-            f.full_hash = hasher.calculate_full_hash(f.path)
+        file1 = _in_memory_file("file1.txt", "content-1")
+        file2 = _in_memory_file("file2.txt", "content-2")
+        file3 = _in_memory_file("file3.txt", "content-3")
 
         # Detect duplicates
         duplicates = detector.find_duplicates([file1, file2, file3])
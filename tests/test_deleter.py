@@ -1,13 +1,26 @@
 """Tests for the Deleter service."""
 
-import tempfile
+import threading
+import time
 from datetime import datetime
-from pathlib import Path
 from typing import List
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from src.models.file_meta import FileMeta
 from src.services.deleter import DeleteResult, Deleter
+from src.services.hash_cache import HashCache
+
+
+# Tests never compare timestamps, so one fixed date serves every FileMeta.
+_NOW = datetime(2024, 1, 1)
+
+
+@pytest.fixture(scope="module")
+def deleter() -> Deleter:
+    """Create a stateless Deleter shared by the tests in this module."""
+    return Deleter()
 
 
 class TestDeleteResult:
@@ -53,9 +66,8 @@ class TestDeleter:
         deleter = Deleter()
         assert deleter is not None
 
-    def test_delete_files_empty_list(self) -> None:
+    def test_delete_files_empty_list(self, deleter: Deleter) -> None:
         """Test delete_files with empty list returns empty result."""
-        deleter = Deleter()
         result = deleter.delete_files([])
 
         assert result.deleted_files == []
@@ -64,76 +76,58 @@ class TestDeleter:
         assert result.total_failed == 0
         assert result.space_saved == 0
 
-    def test_delete_files_single_file(self) -> None:
+    def test_delete_files_single_file(self, deleter: Deleter) -> None:
         """Test delete_files with a single file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Given: A file exists
-            file_path = Path(tmpdir) / "test_file.jpg"
-            file_path.write_bytes(b"test content")
-            file_size = file_path.stat().st_size
-
-            file_meta = FileMeta(
-                path=str(file_path),
-                size=file_size,
-                modified_time=datetime.now(),
-            )
+        # Given: A scanned file (send2trash is mocked, so it need not exist)
+        file_meta = FileMeta(
+            path="/path/to/test_file.jpg",
+            size=12,
+            modified_time=_NOW,
+        )
 
-            # When: Delete the file
-            deleter = Deleter()
-            with patch("src.services.deleter.send2trash") as mock_send2trash:
-                result = deleter.delete_files([file_meta])
+        # When: Delete the file
+        with patch("src.services.deleter.send2trash") as mock_send2trash:
+            result = deleter.delete_files([file_meta])
 
-            # Then: File is deleted successfully
-            mock_send2trash.assert_called_once_with(str(file_path))
-            assert result.total_deleted == 1
-            assert result.total_failed == 0
-            assert result.space_saved == file_size
-            assert str(file_path) in result.deleted_files
+        # Then: File is deleted successfully
+        mock_send2trash.assert_called_once_with("/path/to/test_file.jpg")
+        assert result.total_deleted == 1
+        assert result.total_failed == 0
+        assert result.space_saved == 12
+        assert "/path/to/test_file.jpg" in result.deleted_files
 
-    def test_delete_files_multiple_files(self) -> None:
+    def test_delete_files_multiple_files(self, deleter: Deleter) -> None:
         """Test delete_files with multiple files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Given: Multiple files exist
-            files: List[FileMeta] = []
-            total_size = 0
-
-            for i in range(3):
-                file_path = Path(tmpdir) / f"test_file_{i}.jpg"
-                content = f"test content {i}".encode()
-                file_path.write_bytes(content)
-                file_size = file_path.stat().st_size
-                total_size += file_size
-
-                files.append(
-                    FileMeta(
-                        path=str(file_path),
-                        size=file_size,
-                        modified_time=datetime.now(),
-                    )
-                )
-
-            # When: Delete all files
-            deleter = Deleter()
-            with patch("src.services.deleter.send2trash") as mock_send2trash:
-                result = deleter.delete_files(files)
-
-            # Then: All files are deleted
-            assert mock_send2trash.call_count == 3
-            assert result.total_deleted == 3
-            assert result.total_failed == 0
-            assert result.space_saved == total_size
-
-    def test_delete_files_handles_error(self) -> None:
+        # Given: Multiple scanned files
+        files: List[FileMeta] = [
+            FileMeta(
+                path=f"/path/to/test_file_{i}.jpg",
+                size=100 + i,
+                modified_time=_NOW,
+            )
+            for i in range(3)
+        ]
+
+        # When: Delete all files
+        with patch("src.services.deleter.send2trash") as mock_send2trash:
+            result = deleter.delete_files(files)
+
+        # Then: All files are deleted
+        assert mock_send2trash.call_count == 3
+        assert result.total_deleted == 3
+        assert result.total_failed == 0
+        assert result.space_saved == 303
+
+    def test_delete_files_handles_error(self, deleter: Deleter) -> None:
         """Test delete_files handles errors gracefully."""
         # Given: A file that will fail to delete
         file_meta = FileMeta(
             path="/nonexistent/file.jpg",
             size=1024,
-            modified_time=datetime.now(),
+            modified_time=_NOW,
         )
 
         # When: Try to delete the file
-        deleter = Deleter()
         with patch(
             "src.services.deleter.send2trash",
             side_effect=OSError("File in use"),
@@ -148,22 +142,21 @@ class TestDeleter:
         assert result.failed_files[0][0] == "/nonexistent/file.jpg"
         assert "File in use" in result.failed_files[0][1]
 
-    def test_delete_files_partial_failure(self) -> None:
+    def test_delete_files_partial_failure(self, deleter: Deleter) -> None:
         """Test delete_files with some files failing."""
         # Given: Two files, one will fail
         file1 = FileMeta(
             path="/path/to/success.jpg",
             size=1024,
-            modified_time=datetime.now(),
+            modified_time=_NOW,
         )
         file2 = FileMeta(
             path="/path/to/fail.jpg",
             size=2048,
-            modified_time=datetime.now(),
+            modified_time=_NOW,
         )
 
         # When: Delete files with partial failure
-        deleter = Deleter()
 
         def mock_send2trash(path: str) -> None:
             if "fail" in path:
@@ -182,14 +175,14 @@ class TestDeleter:
         assert "/path/to/success.jpg" in result.deleted_files
         assert result.failed_files[0][0] == "/path/to/fail.jpg"
 
-    def test_delete_files_with_callback(self) -> None:
+    def test_delete_files_with_callback(self, deleter: Deleter) -> None:
         """Test delete_files calls progress callback."""
         # Given: Files to delete with a callback
         files = [
             FileMeta(
                 path=f"/path/to/file{i}.jpg",
                 size=1024,
-                modified_time=datetime.now(),
+                modified_time=_NOW,
             )
             for i in range(3)
         ]
@@ -197,7 +190,6 @@ class TestDeleter:
         callback = MagicMock()
 
         # When: Delete files with callback
-        deleter = Deleter()
         with patch("src.services.deleter.send2trash"):
             result = deleter.delete_files(files, progress_callback=callback)
 
@@ -205,25 +197,100 @@ class TestDeleter:
         assert callback.call_count == 3
         assert result.total_deleted == 3
 
-    def test_format_size_bytes(self) -> None:
+    def test_delete_files_batches_callback(self, deleter: Deleter) -> None:
+        """Test delete_files fires the callback every N files and on the last."""
+        # Given: 10 files and a callback batch size of 4
+        files = [
+            FileMeta(path=f"/path/to/file{i}.jpg", size=1024, modified_time=_NOW)
+            for i in range(10)
+        ]
+        callback = MagicMock()
+
+        # When: Delete files with a batched callback
+        with patch("src.services.deleter.send2trash"):
+            result = deleter.delete_files(
+                files, progress_callback=callback, callback_batch_size=4
+            )
+
+        # Then: Callback fires at 4, 8 and the final file
+        assert result.total_deleted == 10
+        assert [c.args[1] for c in callback.call_args_list] == [4, 8, 10]
+
+    def test_delete_files_rejects_invalid_batch_size(self, deleter: Deleter) -> None:
+        """Test delete_files rejects a callback batch size below 1."""
+        with pytest.raises(ValueError, match="callback_batch_size"):
+            deleter.delete_files([], callback_batch_size=0)
+
+    def test_delete_files_discards_cache_entries(self) -> None:
+        """Test only successfully trashed files are dropped from the hash cache."""
+        # Given: A deleter with a hash cache holding entries for two files
+        cache = HashCache()
+        for path in ("/path/to/success.jpg", "/path/to/fail.jpg"):
+            cache.set(path, "partial", "stamp", "aaa")
+            cache.set(path, "full", "stamp", "bbb")
+        files = [
+            FileMeta(path="/path/to/success.jpg", size=1024, modified_time=_NOW),
+            FileMeta(path="/path/to/fail.jpg", size=2048, modified_time=_NOW),
+        ]
+
+        def mock_send2trash(path: str) -> None:
+            if "fail" in path:
+                raise OSError("Permission denied")
+
+        # When: Delete both files and one of them fails
+        with patch("src.services.deleter.send2trash", side_effect=mock_send2trash):
+            Deleter(hash_cache=cache).delete_files(files)
+
+        # Then: Only the trashed file's entries are removed
+        assert cache.get("/path/to/success.jpg", "full", "stamp") is None
+        assert cache.get("/path/to/success.jpg", "partial", "stamp") is None
+        assert cache.get("/path/to/fail.jpg", "full", "stamp") == "bbb"
+        assert len(cache) == 2
+
+    def test_delete_files_trashes_same_named_files_sequentially(
+        self, deleter: Deleter
+    ) -> None:
+        """Test same-named files are trashed one at a time in input order."""
+        # Given: 50 files named "photo.jpg" in different directories, and a
+        # send2trash mock that fails if a call starts before the last one ends
+        files = [
+            FileMeta(path=f"/dir{i}/photo.jpg", size=1, modified_time=_NOW)
+            for i in range(50)
+        ]
+        calls: List[str] = []
+        in_progress = threading.Event()
+
+        def mock_send2trash(path: str) -> None:
+            assert not in_progress.is_set(), "send2trash called concurrently"
+            in_progress.set()
+            time.sleep(0.001)
+            calls.append(path)
+            in_progress.clear()
+
+        # When: Delete all files
+        with patch("src.services.deleter.send2trash", side_effect=mock_send2trash):
+            result = deleter.delete_files(files)
+
+        # Then: Every file was trashed, sequentially and in input order
+        assert result.total_deleted == 50
+        assert result.total_failed == 0
+        assert calls == [f.path for f in files]
+
+    def test_format_size_bytes(self, deleter: Deleter) -> None:
         """Test format_size with bytes."""
-        deleter = Deleter()
         assert deleter.format_size(500) == "500 B"
 
-    def test_format_size_kilobytes(self) -> None:
+    def test_format_size_kilobytes(self, deleter: Deleter) -> None:
         """Test format_size with kilobytes."""
-        deleter = Deleter()
         assert deleter.format_size(1024) == "1.0 KB"
         assert deleter.format_size(2560) == "2.5 KB"
 
-    def test_format_size_megabytes(self) -> None:
+    def test_format_size_megabytes(self, deleter: Deleter) -> None:
         """Test format_size with megabytes."""
-        deleter = Deleter()
         assert deleter.format_size(1024 * 1024) == "1.0 MB"
         assert deleter.format_size(1024 * 1024 * 5) == "5.0 MB"
 
-    def test_format_size_gigabytes(self) -> None:
+    def test_format_size_gigabytes(self, deleter: Deleter) -> None:
         """Test format_size with gigabytes."""
-        deleter = Deleter()
         assert deleter.format_size(1024 * 1024 * 1024) == "1.0 GB"
         assert deleter.format_size(1024 * 1024 * 1024 * 2) == "2.0 GB"
@@ -1,147 +1,137 @@
 """Tests for DuplicateDetector."""
 
 from datetime import datetime
+from typing import Callable, List, Optional
 from unittest.mock import Mock
+
+import pytest
+
 from src.models.file_meta import FileMeta
 from src.services.detector import DuplicateDetector
 from src.services.hasher import Hasher
 
 
-class TestDuplicateDetector:
-    """Test cases for DuplicateDetector."""
+# Tests never compare timestamps, so one fixed date serves every FileMeta.
+_NOW = datetime(2024, 1, 1)
 
-    def test_find_duplicates_empty_list(self) -> None:
-        """Verify that empty input yields no duplicate groups.
 
-        Args:
-            self: Unused; part of unittest-style test signature.
+def _file(
+    path: str,
+    size: int,
+    partial_hash: Optional[str] = None,
+    full_hash: Optional[str] = None,
+) -> FileMeta:
+    """Build a FileMeta with the shared timestamp."""
+    return FileMeta(
+        path=path,
+        size=size,
+        modified_time=_NOW,
+        partial_hash=partial_hash,
+        full_hash=full_hash,
+    )
 
-        Returns:
-            None.
-        """
-        detector = DuplicateDetector()
-        result = detector.find_duplicates([])
-        assert result == []
 
-    def test_find_duplicates_single_file(self) -> None:
-        """Verify that single file input yields no duplicate groups.
+# Shared read-only inputs: an exact duplicate pair and a file of another size.
+_DUP_A = _file("/test/file1.txt", 100, "hash1", "full1")
+_DUP_B = _file("/test/file2.txt", 100, "hash1", "full1")
+_UNIQ_C = _file("/test/file3.txt", 200, "hash2", "full2")
 
-        Args:
-            self: Unused; part of unittest-style test signature.
 
-        Returns:
-            None.
-        """
-        detector = DuplicateDetector()
-        file = FileMeta(
-            path="/test/file1.txt",
-            size=100,
-            modified_time=datetime.now(),
-        )
-        result = detector.find_duplicates([file])
-        assert result == []
+class _StubHasher(Hasher):
+    """Record the files passed to each parallel hashing stage.
 
-    def test_find_duplicates_different_sizes(self) -> None:
-        """Test that files with different sizes are not grouped."""
-        detector = DuplicateDetector()
-        file1 = FileMeta(
-            path="/test/file1.txt",
-            size=100,
-            modified_time=datetime.now(),
-        )
-        file2 = FileMeta(
-            path="/test/file2.txt",
-            size=200,
-            modified_time=datetime.now(),
-        )
-        result = detector.find_duplicates([file1, file2])
-        assert result == []
+    Replaces the two stage methods of Hasher in find_duplicates_optimized
+    tests; ``on_hash`` lets a test simulate hashing (or its failure) on the
+    files of each stage.
+    """
 
-    def test_find_duplicates_same_size_different_partial_hash(self) -> None:
-        """Test that files with same size but different partial
-        hashes are not grouped."""
-        detector = DuplicateDetector()
-        file1 = FileMeta(
-            path="/test/file1.txt",
-            size=100,
-            modified_time=datetime.now(),
-            partial_hash="hash1",
-        )
-        file2 = FileMeta(
-            path="/test/file2.txt",
-            size=100,
-            modified_time=datetime.now(),
-            partial_hash="hash2",
-        )
-        result = detector.find_duplicates([file1, file2])
-        assert result == []
+    def __init__(
+        self, on_hash: Optional[Callable[[List[FileMeta]], None]] = None
+    ) -> None:
+        super().__init__()
+        self.partial_calls: List[List[FileMeta]] = []
+        self.full_calls: List[List[FileMeta]] = []
+        self._on_hash = on_hash
 
-    def test_find_duplicates_same_size_and_partial_hash_different_full_hash(
-        self,
+    def calculate_partial_hashes_parallel(
+        self, files: List[FileMeta], max_workers: Optional[int] = None
     ) -> None:
-        """Test that files with same size and partial hash but different
-        full hashes are not grouped."""
-        detector = DuplicateDetector()
-        file1 = FileMeta(
-            path="/test/file1.txt",
-            size=100,
-            modified_time=datetime.now(),
-            partial_hash="hash1",
-            full_hash="full1",
-        )
-        file2 = FileMeta(
-            path="/test/file2.txt",
-            size=100,
-            modified_time=datetime.now(),
-            partial_hash="hash1",
-            full_hash="full2",
-        )
-        result = detector.find_duplicates([file1, file2])
-        assert result == []
+        self.partial_calls.append(files)
+        if self._on_hash:
+            self._on_hash(files)
+
+    def calculate_full_hashes_parallel(
+        self, files: List[FileMeta], max_workers: Optional[int] = None
+    ) -> None:
+        self.full_calls.append(files)
+        if self._on_hash:
+            self._on_hash(files)
+
+
+@pytest.fixture(scope="module")
+def detector() -> DuplicateDetector:
+    """Create a stateless DuplicateDetector shared by the tests in this module."""
+    return DuplicateDetector()
+
+
+@pytest.fixture(scope="session")
+def many_files() -> tuple[FileMeta, ...]:
+    """Build 100 files of unique sizes plus one pre-hashed duplicate pair.
+
+    The tuple is shared read-only; the detector never mutates its input here
+    because the hasher is stubbed.
+    """
+    # All different sizes - should be filtered out at size stage
+    unique = [_file(f"/test/file{i}.txt", 100 + i) for i in range(100)]
+    # A few duplicates with pre-computed hashes to avoid file I/O
+    duplicates = [
+        _file(f"/test/dup{i}.txt", 500, "dup_hash", "dup_full") for i in (1, 2)
+    ]
+    return tuple(unique + duplicates)
 
-    def test_find_duplicates_same_size_none_partial_hash(self) -> None:
-        """Test that files with same size and partial_hash=None
-        are not grouped."""
-        detector = DuplicateDetector()
-        file1 = FileMeta(
-            path="/test/file1.txt",
-            size=100,
-            modified_time=datetime.now(),
-            partial_hash=None,
-        )
-        file2 = FileMeta(
-            path="/test/file2.txt",
-            size=100,
-            modified_time=datetime.now(),
-            partial_hash=None,
-        )
-        result = detector.find_duplicates([file1, file2])
-        assert result == []
 
-    def test_find_duplicates_same_size_and_partial_none_full_hash(
+class TestDuplicateDetector:
+    """Test cases for DuplicateDetector."""
+
+    @pytest.mark.parametrize(
+        "specs",
+        [
+            [],
+            [(100, None, None)],
+            [(100, None, None), (200, None, None)],
+            [(100, "hash1", None), (100, "hash2", None)],
+            [(100, "hash1", "full1"), (100, "hash1", "full2")],
+            [(100, None, None), (100, None, None)],
+            [(100, "hash1", None), (100, "hash1", None)],
+        ],
+        ids=[
+            "empty_list",
+            "single_file",
+            "different_sizes",
+            "same_size_different_partial_hash",
+            "same_size_and_partial_hash_different_full_hash",
+            "same_size_none_partial_hash",
+            "same_size_and_partial_none_full_hash",
+        ],
+    )
+    def test_find_duplicates_no_groups(
         self,
+        detector: DuplicateDetector,
+        specs: list[tuple[int, Optional[str], Optional[str]]],
     ) -> None:
-        """Test that files with same size and partial_hash but
-        full_hash=None are not grouped."""
-        detector = DuplicateDetector()
-        file1 = FileMeta(
-            path="/test/file1.txt",
-            size=100,
-            modified_time=datetime.now(),
-            partial_hash="hash1",
-            full_hash=None,
-        )
-        file2 = FileMeta(
-            path="/test/file2.txt",
-            size=100,
-            modified_time=datetime.now(),
-            partial_hash="hash1",
-            full_hash=None,
-        )
-        result = detector.find_duplicates([file1, file2])
-        assert result == []
+        """Verify that inputs without a full (size, partial, full) match yield [].
 
-    def test_find_duplicates_exact_duplicates(self) -> None:
+        Each spec is ``(size, partial_hash, full_hash)`` for one file.
+        """
+        files = [
+            _file(f"/test/file{i}.txt", size, partial_hash, full_hash)
+            for i, (size, partial_hash, full_hash) in enumerate(specs, start=1)
+        ]
+        assert detector.find_duplicates(files) == []
+
+    def test_find_duplicates_exact_duplicates(
+        self, detector: DuplicateDetector
+    ) -> None:
         """Verify that exact duplicates are grouped together correctly.
 
         Args:
@@ -151,31 +141,15 @@ class TestDuplicateDetector:
             None.
         """
         # Given: two identical files (same size, partial_hash, full_hash)
-        detector = DuplicateDetector()
-        file1 = FileMeta(
-            path="/test/file1.txt",
-            size=100,
-            modified_time=datetime.now(),
-            partial_hash="hash1",
-            full_hash="full1",
-        )
-        file2 = FileMeta(
-            path="/test/file2.txt",
-            size=100,
-            modified_time=datetime.now(),
-            partial_hash="hash1",
-            full_hash="full1",
-        )
-
         # When: running duplicate detection
-        result = detector.find_duplicates([file1, file2])
+        result = detector.find_duplicates([_DUP_A, _DUP_B])
 
         # Then: they are grouped together in a single DuplicateGroup
         assert len(result) == 1
         assert len(result[0].files) == 2
         assert result[0].total_size == 200
 
-    def test_find_duplicates_multiple_groups(self) -> None:
+    def test_find_duplicates_multiple_groups(self, detector: DuplicateDetector) -> None:
         """Verify that multiple independent duplicate groups are handled.
 
         Args:
@@ -185,91 +159,44 @@ class TestDuplicateDetector:
             None.
         """
         # Given: multiple groups of exact duplicates and unique files
-        detector = DuplicateDetector()
         # Group 1: exact duplicates
-        file1 = FileMeta(
-            path="/test/file1.txt",
-            size=100,
-            modified_time=datetime.now(),
-            partial_hash="hash1",
-            full_hash="full1",
-        )
-        file2 = FileMeta(
-            path="/test/file2.txt",
-            size=100,
-            modified_time=datetime.now(),
-            partial_hash="hash1",
-            full_hash="full1",
-        )
+        file1 = _file("/test/file1.txt", 100, "hash1", "full1")
+        file2 = _file("/test/file2.txt", 100, "hash1", "full1")
         # Group 2: exact duplicates
-        file3 = FileMeta(
-            path="/test/file3.txt",
-            size=200,
-            modified_time=datetime.now(),
-            partial_hash="hash2",
-            full_hash="full2",
-        )
-        file4 = FileMeta(
-            path="/test/file4.txt",
-            size=200,
-            modified_time=datetime.now(),
-            partial_hash="hash2",
-            full_hash="full2",
-        )
+        file3 = _file("/test/file3.txt", 200, "hash2", "full2")
+        file4 = _file("/test/file4.txt", 200, "hash2", "full2")
         # Unique file
-        file5 = FileMeta(
-            path="/test/file5.txt",
-            size=300,
-            modified_time=datetime.now(),
-            partial_hash="hash3",
-            full_hash="full3",
-        )
+        file5 = _file("/test/file5.txt", 300, "hash3", "full3")
 
         # When: running duplicate detection
         result = detector.find_duplicates([file1, file2, file3, file4, file5])
 
         # Then: exactly two duplicate groups are created
         assert len(result) == 2
+        by_size = {g.total_size: g for g in result}
 
         # Check first group
-        group1 = next(g for g in result if g.total_size == 200)
-        assert len(group1.files) == 2
+        assert len(by_size[200].files) == 2
 
         # Check second group
-        group2 = next(g for g in result if g.total_size == 400)
-        assert len(group2.files) == 2
+        assert len(by_size[400].files) == 2
 
-    def test_find_duplicates_three_same_files(self) -> None:
+    def test_find_duplicates_three_same_files(
+        self, detector: DuplicateDetector
+    ) -> None:
         """Test that three identical files are grouped together."""
-        detector = DuplicateDetector()
-        file1 = FileMeta(
-            path="/test/file1.txt",
-            size=100,
-            modified_time=datetime.now(),
-            partial_hash="hash1",
-            full_hash="full1",
-        )
-        file2 = FileMeta(
-            path="/test/file2.txt",
-            size=100,
-            modified_time=datetime.now(),
-            partial_hash="hash1",
-            full_hash="full1",
-        )
-        file3 = FileMeta(
-            path="/test/file3.txt",
-            size=100,
-            modified_time=datetime.now(),
-            partial_hash="hash1",
-            full_hash="full1",
-        )
+        file1 = _file("/test/file1.txt", 100, "hash1", "full1")
+        file2 = _file("/test/file2.txt", 100, "hash1", "full1")
+        file3 = _file("/test/file3.txt", 100, "hash1", "full1")
 
         result = detector.find_duplicates([file1, file2, file3])
         assert len(result) == 1
         assert len(result[0].files) == 3
         assert result[0].total_size == 300
 
-    def test_find_duplicates_optimized_same_results_as_original(self) -> None:
+    def test_find_duplicates_optimized_same_results_as_original(
+        self, detector: DuplicateDetector
+    ) -> None:
         """Verify optimized method produces same results as original.
 
         Args:
@@ -278,39 +205,14 @@ class TestDuplicateDetector:
         Returns:
             None.
         """
-        # Given: test files with duplicates and mocked hasher
-        detector = DuplicateDetector()
-        hasher = Mock(spec=Hasher)
-        hasher.calculate_partial_hashes_parallel = Mock()
-        hasher.calculate_full_hashes_parallel = Mock()
-
-        file1 = FileMeta(
-            path="/test/file1.txt",
-            size=100,
-            modified_time=datetime.now(),
-            partial_hash="hash1",
-            full_hash="full1",
-        )
-        file2 = FileMeta(
-            path="/test/file2.txt",
-            size=100,
-            modified_time=datetime.now(),
-            partial_hash="hash1",
-            full_hash="full1",
-        )
-        file3 = FileMeta(
-            path="/test/file3.txt",
-            size=200,
-            modified_time=datetime.now(),
-            partial_hash="hash2",
-            full_hash="full2",
-        )
+        # Given: test files with duplicates and stub hasher
+        hasher = _StubHasher()
 
-        # When: comparing both methods
-        original_result = detector.find_duplicates([file1, file2, file3])
-        optimized_result = detector.find_duplicates_optimized(
-            [file1, file2, file3], hasher
-        )
+        files = (_DUP_A, _DUP_B, _UNIQ_C)
+
+        # When: comparing both methods on the same FileMeta objects
+        original_result = detector.find_duplicates(list(files))
+        optimized_result = detector.find_duplicates_optimized(list(files), hasher)
 
         # Then: results should be identical
         assert len(original_result) == len(optimized_result)
@@ -318,7 +220,9 @@ class TestDuplicateDetector:
             assert len(original_result[0].files) == len(optimized_result[0].files)
             assert original_result[0].total_size == optimized_result[0].total_size
 
-    def test_find_duplicates_optimized_progress_callback(self) -> None:
+    def test_find_duplicates_optimized_progress_callback(
+        self, detector: DuplicateDetector
+    ) -> None:
         """Verify progress callback is called at each stage.
 
         Args:
@@ -327,36 +231,24 @@ class TestDuplicateDetector:
         Returns:
             None.
         """
-        # Given: detector with mocked hasher and progress callback
-        detector = DuplicateDetector()
-        hasher = Mock(spec=Hasher)
-        hasher.calculate_partial_hashes_parallel = Mock()
-        hasher.calculate_full_hashes_parallel = Mock()
-        progress_callback = Mock()
+        # Given: detector with stub hasher and progress callback
+        hasher = _StubHasher()
+        progress_count = 0
 
-        # Create files with same size to ensure they go through all stages
-        file1 = FileMeta(
-            path="/test/file1.txt",
-            size=100,
-            modified_time=datetime.now(),
-            partial_hash="hash1",
-            full_hash="full1",
-        )
-        file2 = FileMeta(
-            path="/test/file2.txt",
-            size=100,
-            modified_time=datetime.now(),
-            partial_hash="hash1",
-            full_hash="full1",
-        )
+        def progress_callback(message: str, current: int, total: int) -> None:
+            nonlocal progress_count
+            progress_count += 1
 
-        # When: running optimized method with progress callback
-        detector.find_duplicates_optimized([file1, file2], hasher, progress_callback)
+        # When: running optimized method with progress callback on files of the
+        # same size, so they go through all stages
+        detector.find_duplicates_optimized([_DUP_A, _DUP_B], hasher, progress_callback)
 
         # Then: progress callback should be called multiple times
-        assert progress_callback.call_count >= 5  # All stages + completion
+        assert progress_count >= 5  # All stages + completion
 
-    def test_find_duplicates_optimized_performance_improvement(self) -> None:
+    def test_find_duplicates_optimized_performance_improvement(
+        self, detector: DuplicateDetector, many_files: tuple[FileMeta, ...]
+    ) -> None:
         """Verify that optimized method reduces hash computations significantly.
 
         Args:
@@ -365,59 +257,24 @@ class TestDuplicateDetector:
         Returns:
             None.
         """
-        # Given: detector with mocked hasher and many files with mostly unique sizes
-        detector = DuplicateDetector()
-        hasher = Mock(spec=Hasher)
-        hasher.calculate_partial_hashes_parallel = Mock()
-        hasher.calculate_full_hashes_parallel = Mock()
-
-        # Create many files with different sizes (most should be filtered out early)
-        files = []
-        for i in range(100):
-            files.append(
-                FileMeta(
-                    path=f"/test/file{i}.txt",
-                    size=100
-                    + i,  # All different sizes - should be filtered out at size stage
-                    modified_time=datetime.now(),
-                )
-            )
-
-        # Add a few duplicates with pre-computed hashes to avoid file I/O
-        files.extend(
-            [
-                FileMeta(
-                    path="/test/dup1.txt",
-                    size=500,
-                    modified_time=datetime.now(),
-                    partial_hash="dup_hash",
-                    full_hash="dup_full",
-                ),
-                FileMeta(
-                    path="/test/dup2.txt",
-                    size=500,
-                    modified_time=datetime.now(),
-                    partial_hash="dup_hash",
-                    full_hash="dup_full",
-                ),
-            ]
-        )
+        # Given: detector with stub hasher and many files with mostly unique sizes
+        hasher = _StubHasher()
 
         # When: running optimized method
-        result = detector.find_duplicates_optimized(files, hasher)
+        result = detector.find_duplicates_optimized(list(many_files), hasher)
 
         # Then: should find the duplicates and avoid unnecessary hash computations
         assert len(result) == 1
         assert len(result[0].files) == 2
 
-        # Verify that only duplicate files had hashes computed
-        partial_call_args = hasher.calculate_partial_hashes_parallel.call_args[0][0]
-        assert len(partial_call_args) == 2  # Only the 2 duplicates
+        # Verify that only the 2 duplicate files had hashes computed, once each
+        duplicates = list(many_files[-2:])
+        assert hasher.partial_calls == [duplicates]
+        assert hasher.full_calls == [duplicates]
 
-        full_call_args = hasher.calculate_full_hashes_parallel.call_args[0][0]
-        assert len(full_call_args) == 2  # Only the 2 duplicates
-
-    def test_find_duplicates_optimized_empty_list(self) -> None:
+    def test_find_duplicates_optimized_empty_list(
+        self, detector: DuplicateDetector
+    ) -> None:
         """Verify optimized method handles empty input gracefully.
 
         Args:
@@ -426,9 +283,8 @@ class TestDuplicateDetector:
         Returns:
             None.
         """
-        # Given: detector with mocked hasher and empty file list
-        detector = DuplicateDetector()
-        hasher = Mock(spec=Hasher)
+        # Given: detector with stub hasher and empty file list
+        hasher = _StubHasher()
         progress_callback = Mock()
 
         # When: running optimized method with empty list
@@ -438,7 +294,9 @@ class TestDuplicateDetector:
         assert result == []
         progress_callback.assert_called_with("No files to process", 0, 0)
 
-    def test_find_duplicates_optimized_handles_hash_failures(self) -> None:
+    def test_find_duplicates_optimized_handles_hash_failures(
+        self, detector: DuplicateDetector
+    ) -> None:
         """Verify graceful handling when hasher fails for some files.
 
         Args:
@@ -447,31 +305,20 @@ class TestDuplicateDetector:
         Returns:
             None.
         """
-        # Given: detector with mocked hasher that clears hashes on failure
-        detector = DuplicateDetector()
-        hasher = Mock(spec=Hasher)
 
+        # Given: detector with stub hasher that clears hashes on failure
         # Simulate hasher clearing hashes on failure
-        def clear_hashes(files):
+        def clear_hashes(files: List[FileMeta]) -> None:
             for f in files:
                 f.partial_hash = None
                 f.full_hash = None
 
-        hasher.calculate_partial_hashes_parallel.side_effect = clear_hashes
-        hasher.calculate_full_hashes_parallel.side_effect = clear_hashes
+        hasher = _StubHasher(on_hash=clear_hashes)
         progress_callback = Mock()
 
         # Create files that would be duplicates but hasher fails
-        file1 = FileMeta(
-            path="/test/file1.txt",
-            size=100,
-            modified_time=datetime.now(),
-        )
-        file2 = FileMeta(
-            path="/test/file2.txt",
-            size=100,
-            modified_time=datetime.now(),
-        )
+        file1 = _file("/test/file1.txt", 100)
+        file2 = _file("/test/file2.txt", 100)
 
         # When: running optimized method with failing hasher
         result = detector.find_duplicates_optimized(
@@ -483,7 +330,9 @@ class TestDuplicateDetector:
         # Progress callback should be called through all stages but may exit early
         assert progress_callback.call_count >= 4
 
-    def test_find_duplicates_optimized_no_size_candidates(self) -> None:
+    def test_find_duplicates_optimized_no_size_candidates(
+        self, detector: DuplicateDetector
+    ) -> None:
         """Verify optimized method handles files with unique sizes.
 
         Args:
@@ -492,16 +341,13 @@ class TestDuplicateDetector:
         Returns:
             None.
         """
-        # Given: detector with mocked hasher and files of unique sizes
-        detector = DuplicateDetector()
-        hasher = Mock(spec=Hasher)
-        hasher.calculate_partial_hashes_parallel = Mock()
-        hasher.calculate_full_hashes_parallel = Mock()
+        # Given: detector with stub hasher and files of unique sizes
+        hasher = _StubHasher()
         progress_callback = Mock()
 
         # Create files with different sizes
-        file1 = FileMeta(path="/test/file1.txt", size=100, modified_time=datetime.now())
-        file2 = FileMeta(path="/test/file2.txt", size=200, modified_time=datetime.now())
+        file1 = _file("/test/file1.txt", 100)
+        file2 = _file("/test/file2.txt", 200)
 
         # When: running optimized method
         result = detector.find_duplicates_optimized(
@@ -510,5 +356,5 @@ class TestDuplicateDetector:
 
         # Then: should return empty list and not call hash methods
         assert result == []
-        hasher.calculate_partial_hashes_parallel.assert_not_called()
-        hasher.calculate_full_hashes_parallel.assert_not_called()
+        assert hasher.partial_calls == []
+        assert hasher.full_calls == []
@@ -0,0 +1,209 @@
+"""HashCacheのテスト"""
+
+import hashlib
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.services.hash_cache import HashCache
+from src.services.hasher import Hasher
+
+
+class TestHashCache:
+    """HashCacheクラスのテスト"""
+
+    def test_memory_cache_get_and_set(self):
+        """メモリ上のキャッシュに保存した値を取得できるテスト"""
+        # Given: パス未指定のキャッシュ
+        cache = HashCache()
+
+        # When: 値を保存
+        cache.set("/data/a.bin", "full", "10:100", "abc123")
+
+        # Then: 同じパス・種類・スタンプで保存した値だけが取得できる
+        assert cache.get("/data/a.bin", "full", "10:100") == "abc123"
+        assert cache.get("/data/a.bin", "full", "10:200") is None
+        assert cache.get("/data/a.bin", "partial", "10:100") is None
+        assert cache.get("/data/missing.bin", "full", "10:100") is None
+        assert len(cache) == 1
+
+    def test_persistent_cache_survives_reopen(self, tmp_path: Path):
+        """ディスクに永続化したキャッシュを開き直しても値が残るテスト"""
+        # Given: ファイルに永続化するキャッシュ
+        cache_path = tmp_path / "hashes"
+        cache = HashCache(cache_path)
+        cache.set("/data/a.bin", "full", "10:100", "abc123")
+        cache.close()
+
+        # When: 同じパスで開き直す
+        reopened = HashCache(cache_path)
+
+        # Then: 保存済みの値が取得できる
+        try:
+            assert reopened.get("/data/a.bin", "full", "10:100") == "abc123"
+        finally:
+            reopened.close()
+
+    @pytest.mark.parametrize("persistent", [False, True])
+    def test_discard_removes_all_kinds(self, tmp_path: Path, persistent: bool):
+        """discardでファイルの部分・完全ハッシュのエントリが削除されるテスト"""
+        # Given: 2つのファイルの部分・完全ハッシュを保存したキャッシュ
+        cache = HashCache(tmp_path / "hashes" if persistent else None)
+        for path in ("/data/a.bin", "/data/b.bin"):
+            cache.set(path, "partial", "10:100", "aaa")
+            cache.set(path, "full", "10:100", "bbb")
+
+        try:
+            # When: 片方のファイルと未登録のファイルを削除
+            cache.discard("/data/a.bin")
+            cache.discard("/data/missing.bin")
+
+            # Then: 削除したファイルのエントリだけが無くなる
+            assert cache.get("/data/a.bin", "partial", "10:100") is None
+            assert cache.get("/data/a.bin", "full", "10:100") is None
+            assert cache.get("/data/b.bin", "full", "10:100") == "bbb"
+            assert len(cache) == 2
+        finally:
+            cache.close()
+
+    @pytest.mark.parametrize("persistent", [False, True])
+    def test_use_after_close_raises(self, tmp_path: Path, persistent: bool):
+        """閉じたキャッシュを使うとValueErrorが送出されるテスト"""
+        # Given: 閉じたキャッシュ
+        cache = HashCache(tmp_path / "hashes" if persistent else None)
+        cache.close()
+
+        # When/Then: どの操作もメモリ上の辞書に切り替わらずにエラーになる
+        with pytest.raises(ValueError, match="closed"):
+            cache.get("/data/a.bin", "full", "10:100")
+        with pytest.raises(ValueError, match="closed"):
+            cache.set("/data/a.bin", "full", "10:100", "abc123")
+        with pytest.raises(ValueError, match="closed"):
+            cache.discard("/data/a.bin")
+        with pytest.raises(ValueError, match="closed"):
+            len(cache)
+
+    def test_hasher_stats_each_file_once(self, tmp_path: Path, monkeypatch):
+        """キャッシュ付きのcompute_hashesがファイルを1回だけstatし、パスを解決しないテスト"""
+        # Given: キャッシュ付きのHasherと、statとresolveの呼び出しを数える仕掛け
+        file_path = tmp_path / "file.bin"
+        file_path.write_bytes(b"stat once" * 1024)
+        hasher = Hasher(cache=HashCache())
+        calls = {"stat": 0, "resolve": 0}
+        original_stat = Path.stat
+
+        def counting_stat(self, *args, **kwargs):
+            calls["stat"] += 1
+            return original_stat(self, *args, **kwargs)
+
+        def fail_resolve(self, *args, **kwargs):
+            calls["resolve"] += 1
+            raise AssertionError("cache keys should not resolve paths")
+
+        monkeypatch.setattr(Path, "stat", counting_stat)
+        monkeypatch.setattr(Path, "resolve", fail_resolve)
+
+        # When: 未キャッシュのファイルとキャッシュ済みのファイルのハッシュを計算
+        hasher.compute_hashes(file_path)
+        hasher.compute_hashes(file_path)
+
+        # Then: 1回の計算につきstatは1回で、resolveは呼ばれない
+        assert calls == {"stat": 2, "resolve": 0}
+
+    def test_hasher_returns_cached_hash_without_reading(
+        self, tmp_path: Path, monkeypatch
+    ):
+        """キャッシュ済みのファイルは再計算せずにハッシュを返すテスト"""
+        # Given: キャッシュ付きのHasherで一度ハッシュ計算したファイル
+        file_path = tmp_path / "file.bin"
+        content = b"cached" * 4096
+        file_path.write_bytes(content)
+        hasher = Hasher(cache=HashCache())
+        partial_hash, full_hash = hasher.compute_hashes(file_path)
+
+        def fail_hash_object():
+            raise AssertionError("hash should be served from the cache")
+
+        monkeypatch.setattr(hasher, "_get_hash_object", fail_hash_object)
+
+        # When: 同じファイルのハッシュを再度計算
+        cached_partial, cached_full = hasher.compute_hashes(file_path)
+        cached_full_only = hasher.calculate_full_hash(file_path)
+
+        # Then: キャッシュから同じ値が返される
+        assert cached_full == full_hash == hashlib.sha256(content).hexdigest()
+        assert cached_partial == partial_hash
+        assert cached_full_only == full_hash
+
+    def test_hasher_recomputes_when_file_changes(self, tmp_path: Path):
+        """ファイルが更新された場合はキャッシュを使わず再計算するテスト"""
+        # Given: キャッシュ済みのファイル
+        file_path = tmp_path / "file.bin"
+        file_path.write_bytes(b"before")
+        hasher = Hasher(cache=HashCache())
+        hasher.calculate_full_hash(file_path)
+
+        # When: 内容と更新時刻を変更して再計算
+        file_path.write_bytes(b"after!")
+        stat_result = file_path.stat()
+        os.utime(
+            file_path,
+            ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000),
+        )
+        result = hasher.calculate_full_hash(file_path)
+
+        # Then: 新しい内容のハッシュ値が返される
+        assert result == hashlib.sha256(b"after!").hexdigest()
+
+    def test_changed_file_overwrites_its_entry(self, tmp_path: Path):
+        """ファイルが更新されても永続化したキャッシュのエントリが増えないテスト"""
+        # Given: ディスクに永続化したキャッシュでハッシュ計算済みのファイル
+        file_path = tmp_path / "file.bin"
+        file_path.write_bytes(b"before")
+        cache = HashCache(tmp_path / "hashes")
+        hasher = Hasher(cache=cache)
+        hasher.calculate_full_hash(file_path)
+
+        try:
+            # When: 内容と更新時刻を変えて何度も再計算
+            for i in range(3):
+                file_path.write_bytes(f"after {i}".encode())
+                stat_result = file_path.stat()
+                os.utime(
+                    file_path,
+                    ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + (i + 1)),
+                )
+                result = hasher.calculate_full_hash(file_path)
+
+            # Then: 最新の内容のハッシュ値が返され、エントリは1つのまま
+            assert result == hashlib.sha256(b"after 2").hexdigest()
+            assert len(cache) == 1
+        finally:
+            cache.close()
+
+    @pytest.mark.skipif(
+        sys.platform != "linux", reason="UTF-8として不正なファイル名はLinuxのみ作成可能"
+    )
+    def test_persistent_cache_handles_non_utf8_filename(self, tmp_path: Path):
+        """UTF-8として不正なファイル名でも永続化キャッシュを使ってハッシュ計算できるテスト"""
+        # Given: 名前がUTF-8として不正なファイルと、ディスクに永続化するキャッシュ
+        raw_path = os.path.join(os.fsencode(tmp_path), b"caf\xe9.txt")
+        with open(raw_path, "wb") as f:
+            f.write(b"latin-1 name")
+        file_path = Path(os.fsdecode(raw_path))
+        cache = HashCache(tmp_path / "hashes")
+        hasher = Hasher(cache=cache)
+
+        try:
+            # When: 2回ハッシュを計算
+            first = hasher.calculate_full_hash(file_path)
+            second = hasher.calculate_full_hash(file_path)
+
+            # Then: 正しいハッシュ値が返され、キャッシュにも保存される
+            expected = hashlib.sha256(b"latin-1 name").hexdigest()
+            assert first == second == expected
+            assert len(cache) == 1
+        finally:
+            cache.close()
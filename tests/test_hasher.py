@@ -2,6 +2,7 @@
 
 import hashlib
 import logging
+import os
 import tempfile
 from datetime import datetime
 from pathlib import Path
@@ -10,7 +11,8 @@ import time
 import pytest
 
 from src.models.file_meta import FileMeta
-from src.services.hasher import Hasher
+from src.models.scan_config import ScanConfig
+from src.services.hasher import PREFETCH_SIZE, Hasher
 
 
 class TestHasher:
@@ -37,6 +39,24 @@ class TestHasher:
         finally:
             Path(temp_file_path).unlink()
 
+    def test_calculate_partial_hash_empty_file_skips_read(self, tmp_path, monkeypatch):
+        """空ファイルの部分ハッシュは読み込まずに空データのハッシュ値を返すテスト"""
+        # Given: 空のファイルと、呼ばれると失敗するopen
+        file_path = tmp_path / "empty.bin"
+        file_path.write_bytes(b"")
+        hasher = Hasher()
+
+        def fail_open(*args, **kwargs):
+            raise AssertionError("empty file should not be opened")
+
+        monkeypatch.setattr("builtins.open", fail_open)
+
+        # When: 部分ハッシュを計算
+        result = hasher.calculate_partial_hash(file_path)
+
+        # Then: 空データのハッシュ値が返される
+        assert result == hashlib.sha256(b"").hexdigest()
+
     def test_calculate_partial_hashes_parallel_updates_filemeta(self):
         """複数ファイルの部分ハッシュがインプレースで更新されることを確認する。"""
         contents = [b"A" * 1024, b"B" * 2048, b"C" * 4096]
@@ -229,6 +249,220 @@ class TestHasher:
             for path in temp_files:
                 path.unlink()
 
+    def test_hash_many_updates_both_hashes(self, caplog):
+        """hash_manyで部分ハッシュと完全ハッシュの両方が設定され、エラーは継続される。"""
+        # Given: 2つの有効ファイルと1つの存在しないファイル
+        temp_files: list[Path] = []
+        files: list[FileMeta] = []
+
+        for i in range(2):
+            with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+                content = f"hash-many-{i}".encode("utf-8") * 1024
+                temp_file.write(content)
+                path = Path(temp_file.name)
+            temp_files.append(path)
+            files.append(
+                FileMeta(
+                    path=str(path),
+                    size=len(content),
+                    modified_time=datetime.fromtimestamp(path.stat().st_mtime),
+                )
+            )
+
+        missing_path = "/path/to/nonexistent/file-for-hash-many.txt"
+        missing_meta = FileMeta(
+            path=missing_path,
+            size=0,
+            modified_time=datetime.fromtimestamp(0),
+        )
+        files.append(missing_meta)
+
+        try:
+            hasher = Hasher()
+
+            # When: 両方のハッシュをまとめて並列計算
+            with caplog.at_level(logging.WARNING):
+                hasher.hash_many(files, max_workers=4)
+
+            # Then: 有効ファイルは両方のハッシュが個別計算と一致する
+            for file_meta, path in zip(files[:2], temp_files):
+                assert file_meta.partial_hash == hasher.calculate_partial_hash(
+                    str(path)
+                )
+                assert file_meta.full_hash == hasher.calculate_full_hash(str(path))
+
+            assert missing_meta.partial_hash is None
+            assert missing_meta.full_hash is None
+            messages = [record.getMessage() for record in caplog.records]
+            assert any(
+                "Failed to calculate hashes for" in message and missing_path in message
+                for message in messages
+            )
+        finally:
+            for path in temp_files:
+                path.unlink()
+
+    def test_hash_many_does_not_prefetch_up_front(self, tmp_path, monkeypatch):
+        """hash_manyはハッシュ計算前に全ファイルを直列に開いて先読みしない。"""
+        # Given: 2つのファイルと、呼ばれたら失敗するprefetch
+        files = []
+        for name in ("a.bin", "b.bin"):
+            path = tmp_path / name
+            path.write_bytes(b"same")
+            files.append(FileMeta(path=str(path), size=4, modified_time=datetime.now()))
+        hasher = Hasher()
+
+        def unexpected_prefetch(paths):
+            raise AssertionError("hash_many must not prefetch every file first")
+
+        monkeypatch.setattr(hasher, "prefetch", unexpected_prefetch)
+
+        # When: 複数ファイルのハッシュを計算
+        hasher.hash_many(files)
+
+        # Then: 全ファイルのハッシュが設定される
+        expected = hashlib.sha256(b"same").hexdigest()
+        assert all(f.full_hash == expected for f in files)
+
+    def test_hash_many_single_file_skips_thread_pool(self, monkeypatch):
+        """1ファイルだけのhash_manyはスレッドプールを作らずに計算する。"""
+        # Given: 1つの有効ファイルと、生成されると失敗するスレッドプール
+        content = b"single-file" * 1024
+        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+            temp_file.write(content)
+            path = Path(temp_file.name)
+        file_meta = FileMeta(
+            path=str(path),
+            size=len(content),
+            modified_time=datetime.fromtimestamp(path.stat().st_mtime),
+        )
+
+        def fail_executor(*args, **kwargs):
+            raise AssertionError("ThreadPoolExecutor should not be created")
+
+        monkeypatch.setattr("src.services.hasher.ThreadPoolExecutor", fail_executor)
+
+        try:
+            hasher = Hasher()
+
+            # When: 1ファイルだけをまとめて計算
+            hasher.hash_many([file_meta])
+
+            # Then: 両方のハッシュが設定される
+            assert file_meta.partial_hash == hasher.calculate_partial_hash(str(path))
+            assert file_meta.full_hash == hashlib.sha256(content).hexdigest()
+        finally:
+            path.unlink()
+
+    def test_full_hashes_parallel_starts_largest_files_first(self, monkeypatch):
+        """完全ハッシュの並列計算はサイズの大きいファイルから開始する。"""
+        # Given: サイズがばらばらのファイルと、呼び出し順を記録する完全ハッシュ
+        hasher = Hasher()
+        started: list[str] = []
+
+        def recording_full_hash(file_path):
+            started.append(file_path)
+            return "hash"
+
+        monkeypatch.setattr(hasher, "calculate_full_hash", recording_full_hash)
+        files = [
+            FileMeta(path=f"/f{size}", size=size, modified_time=datetime.now())
+            for size in (10_000, 90_000, 50_000)
+        ]
+
+        # When: 1スレッドで完全ハッシュを並列計算
+        hasher.calculate_full_hashes_parallel(files, max_workers=1)
+
+        # Then: サイズの降順に計算され、全ファイルにハッシュが設定される
+        assert started == ["/f90000", "/f50000", "/f10000"]
+        assert all(f.full_hash == "hash" for f in files)
+
+    def test_parallel_hashes_use_config_workers(self, monkeypatch):
+        """並列ハッシュはScanConfigのワーカー数をファイル数で制限して使う。"""
+        # Given: parallel_workers=2 の設定と、生成時の引数を記録するスレッドプール
+        from concurrent.futures import ThreadPoolExecutor
+
+        created: list[int] = []
+
+        def recording_executor(max_workers):
+            created.append(max_workers)
+            return ThreadPoolExecutor(max_workers=max_workers)
+
+        monkeypatch.setattr(
+            "src.services.hasher.ThreadPoolExecutor", recording_executor
+        )
+        hasher = Hasher(config=ScanConfig(parallel_workers=2))
+        files = [
+            FileMeta(path=f"/nonexistent/{i}", size=1, modified_time=datetime.now())
+            for i in range(3)
+        ]
+
+        # When: 3ファイルと1ファイルの部分ハッシュを並列計算
+        hasher.calculate_partial_hashes_parallel(files)
+        hasher.calculate_partial_hashes_parallel(files[:1])
+
+        # Then: 設定値とファイル数の小さい方がワーカー数になる
+        assert hasher.parallel_workers == 2
+        assert created == [2, 1]
+
+    @pytest.mark.skipif(
+        not hasattr(os, "posix_fadvise"), reason="posix_fadvise is not available"
+    )
+    def test_prefetch_advises_willneed_and_skips_missing(self, tmp_path, monkeypatch):
+        """prefetchが存在するファイルにだけ先読みを予告するテスト"""
+        # Given: 2つのファイルと存在しないパス、posix_fadviseの呼び出し記録
+        paths = [tmp_path / "a.bin", tmp_path / "b.bin"]
+        for path in paths:
+            path.write_bytes(b"prefetch")
+        advice_calls: list[tuple[int, int, int]] = []
+        monkeypatch.setattr(
+            "src.services.hasher.os.posix_fadvise",
+            lambda fd, offset, length, advice: advice_calls.append(
+                (offset, length, advice)
+            ),
+        )
+
+        # When: 先読みを予告
+        Hasher().prefetch([*paths, tmp_path / "missing.bin"])
+
+        # Then: 存在するファイルごとに先頭の先読みが予告される
+        assert advice_calls == [
+            (0, PREFETCH_SIZE, os.POSIX_FADV_WILLNEED),
+            (0, PREFETCH_SIZE, os.POSIX_FADV_WILLNEED),
+        ]
+
+    def test_full_hashes_parallel_reuses_partial_hash_for_small_files(
+        self, monkeypatch
+    ):
+        """部分ハッシュが全体を覆う小さいファイルは完全ハッシュ計算で再読み込みしない。"""
+        # Given: 部分ハッシュ計算済みの小さいファイル (2 * chunk_size 以下)
+        content = b"S" * 8192
+        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+            temp_file.write(content)
+            path = Path(temp_file.name)
+
+        file_meta = FileMeta(
+            path=str(path),
+            size=len(content),
+            modified_time=datetime.fromtimestamp(path.stat().st_mtime),
+        )
+        hasher = Hasher()
+        file_meta.partial_hash = hasher.calculate_partial_hash(file_meta.path)
+
+        def fail_full_hash(path: str) -> str:
+            raise AssertionError("calculate_full_hash should not be called")
+
+        monkeypatch.setattr(hasher, "calculate_full_hash", fail_full_hash)
+
+        try:
+            # When: 完全ハッシュを並列計算
+            hasher.calculate_full_hashes_parallel([file_meta])
+
+            # Then: ファイル全体のハッシュとして部分ハッシュが流用される
+            assert file_meta.full_hash == hashlib.sha256(content).hexdigest()
+        finally:
+            path.unlink()
+
     def test_full_hashes_parallel_is_faster_than_sequential(self, monkeypatch):
         """完全ハッシュの並列計算がシーケンシャルより高速であることを緩やかに確認する。"""
         temp_files: list[Path] = []
@@ -363,6 +597,67 @@ class TestHasher:
         finally:
             Path(temp_file_path).unlink()
 
+    def test_calculate_full_hash_multiple_chunks(self):
+        """複数チャンクにまたがるファイルの完全ハッシュ計算テスト"""
+        # Given: チャンクサイズの倍数でない複数チャンクのファイル
+        test_content = bytes(range(256)) * 40  # 10KB (4KB × 2 + 2KB)
+        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+            temp_file.write(test_content)
+            temp_file_path = temp_file.name
+
+        try:
+            hasher = Hasher()
+
+            # When: 完全ハッシュを計算
+            result = hasher.calculate_full_hash(temp_file_path)
+
+            # Then: 最終チャンクの端数も含めたファイル全体のハッシュ値が返される
+            expected_hash = hashlib.sha256(test_content).hexdigest()
+            assert result == expected_hash
+        finally:
+            Path(temp_file_path).unlink()
+
+    @pytest.mark.skipif(
+        not hasattr(os, "posix_fadvise"), reason="posix_fadvise is not available"
+    )
+    def test_calculate_full_hash_releases_page_cache(self, tmp_path, monkeypatch):
+        """完全ハッシュ計算後にページキャッシュの破棄を通知するテスト"""
+        # Given: ファイルとposix_fadviseの呼び出し記録
+        file_path = tmp_path / "file.bin"
+        file_path.write_bytes(b"page-cache" * 1024)
+        advice_calls: list[int] = []
+        monkeypatch.setattr(
+            "src.services.hasher.os.posix_fadvise",
+            lambda fd, offset, length, advice: advice_calls.append(advice),
+        )
+
+        # When: 完全ハッシュを計算
+        Hasher().calculate_full_hash(file_path)
+
+        # Then: 順次アクセスを通知し、読み終えたらキャッシュ破棄を通知する
+        assert advice_calls == [os.POSIX_FADV_SEQUENTIAL, os.POSIX_FADV_DONTNEED]
+
+    @pytest.mark.skipif(
+        not hasattr(os, "posix_fadvise"), reason="posix_fadvise is not available"
+    )
+    def test_calculate_full_hash_ignores_fadvise_errors(self, tmp_path, monkeypatch):
+        """posix_fadviseが失敗しても完全ハッシュを計算できるテスト"""
+        # Given: ファイルと、常に失敗するposix_fadvise
+        file_path = tmp_path / "file.bin"
+        content = b"fuse" * 4096
+        file_path.write_bytes(content)
+
+        def failing_fadvise(fd, offset, length, advice):
+            raise OSError("Operation not supported")
+
+        monkeypatch.setattr("src.services.hasher.os.posix_fadvise", failing_fadvise)
+
+        # When: 完全ハッシュを計算
+        result = Hasher().calculate_full_hash(file_path)
+
+        # Then: 通知の失敗は無視され、正しいハッシュ値が返される
+        assert result == hashlib.sha256(content).hexdigest()
+
     def test_calculate_full_hash_empty_file(self):
         """空ファイルの完全ハッシュ計算テスト"""
         # Given: 空のファイル
@@ -381,6 +676,46 @@ class TestHasher:
         finally:
             Path(temp_file_path).unlink()
 
+    @pytest.mark.parametrize("size", [0, 1, 4096, 8192, 8193, 10240, 16384, 600_000])
+    def test_compute_hashes_matches_individual_hashes(self, size):
+        """compute_hashesの結果が部分・完全ハッシュの個別計算と一致するテスト"""
+        # Given: 先頭・中間・末尾で内容が異なるファイル
+        test_content = bytes(i % 251 for i in range(size))
+        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+            temp_file.write(test_content)
+            temp_file_path = temp_file.name
+
+        try:
+            hasher = Hasher()
+
+            # When: 1回の読み込みで両方のハッシュを計算
+            partial_hash, full_hash = hasher.compute_hashes(temp_file_path)
+
+            # Then: 個別に計算した結果と一致する
+            assert partial_hash == hasher.calculate_partial_hash(temp_file_path)
+            assert full_hash == hasher.calculate_full_hash(temp_file_path)
+        finally:
+            Path(temp_file_path).unlink()
+
+    def test_identical_files_share_hash_object(self, tmp_path):
+        """同じ内容のファイルのハッシュ値が同一の文字列オブジェクトになるテスト"""
+        # Given: 同じ内容の2つのファイル
+        content = b"same-content" * 2048
+        first = tmp_path / "first.bin"
+        second = tmp_path / "second.bin"
+        first.write_bytes(content)
+        second.write_bytes(content)
+        hasher = Hasher()
+
+        # When: それぞれのハッシュを計算
+        first_hashes = hasher.compute_hashes(first)
+        second_hashes = hasher.compute_hashes(second)
+
+        # Then: 部分・完全ハッシュとも同一オブジェクトが返される
+        assert first_hashes[0] is second_hashes[0]
+        assert first_hashes[1] is second_hashes[1]
+        assert hasher.calculate_full_hash(first) is first_hashes[1]
+
     def test_hash_nonexistent_file(self):
         """存在しないファイルのハッシュ計算テスト"""
         # Given: 存在しないファイルパス
@@ -394,6 +729,9 @@ class TestHasher:
         with pytest.raises(FileNotFoundError):
             hasher.calculate_full_hash(nonexistent_path)
 
+        with pytest.raises(FileNotFoundError):
+            hasher.compute_hashes(nonexistent_path)
+
     def test_hash_file_meta_integration(self):
         """FileMetaとの連携テスト"""
         # Given: FileMetaオブジェクトとテストファイル
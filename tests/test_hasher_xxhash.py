@@ -22,7 +22,7 @@ class TestHasherXxhash:
 
         # Then: 設定が反映される
         assert hasher.chunk_size == 65536
-        assert hasher.hash_algorithm == "xxhash64"
+        assert hasher.hash_algorithm == "xxh3_128"
 
     def test_init_with_scan_config_custom(self):
         """ScanConfigを使用した初期化テスト（カスタム値）"""
@@ -128,6 +128,73 @@ class TestHasherXxhash:
         finally:
             Path(temp_file_path).unlink()
 
+    def test_blake2b_uses_128bit_digest(self):
+        """blake2b指定時に128bitのダイジェストが生成されることを確認"""
+        # Given: テストファイル
+        test_content = b"Test content for blake2b"
+        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+            temp_file.write(test_content)
+            temp_file_path = temp_file.name
+
+        try:
+            # When: blake2bでハッシュを計算
+            hasher = Hasher(ScanConfig(hash_algorithm="blake2b"))
+            result = hasher.calculate_full_hash(temp_file_path)
+
+            # Then: 16バイトのblake2bダイジェストが返される
+            import hashlib
+
+            expected_hash = hashlib.blake2b(test_content, digest_size=16).hexdigest()
+            assert result == expected_hash
+            assert len(result) == 32  # 128bitは16進数で32文字
+
+        finally:
+            Path(temp_file_path).unlink()
+
+    def test_xxh3_128_full_hash(self):
+        """xxh3_128指定時に128bitのxxh3ダイジェストが生成されることを確認"""
+        # Given: テストファイル
+        test_content = b"Test content for xxh3" * 500
+        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+            temp_file.write(test_content)
+            temp_file_path = temp_file.name
+
+        try:
+            # When: xxh3_128でハッシュを計算
+            hasher = Hasher(ScanConfig(hash_algorithm="xxh3_128"))
+            result = hasher.calculate_full_hash(temp_file_path)
+
+            # Then: xxh3_128のダイジェストが返される
+            import xxhash
+
+            assert result == xxhash.xxh3_128_hexdigest(test_content)
+            assert len(result) == 32  # 128bitは16進数で32文字
+
+        finally:
+            Path(temp_file_path).unlink()
+
+    def test_xxh3_64_partial_hash(self):
+        """xxh3_64指定時に64bitのxxh3ダイジェストが生成されることを確認"""
+        # Given: テストファイル
+        test_content = b"Test content for xxh3_64"
+        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
+            temp_file.write(test_content)
+            temp_file_path = temp_file.name
+
+        try:
+            # When: xxh3_64で部分ハッシュを計算
+            hasher = Hasher(ScanConfig(hash_algorithm="xxh3_64"))
+            result = hasher.calculate_partial_hash(temp_file_path)
+
+            # Then: xxh3_64のダイジェストが返される
+            import xxhash
+
+            assert result == xxhash.xxh3_64_hexdigest(test_content)
+            assert len(result) == 16  # 64bitは16進数で16文字
+
+        finally:
+            Path(temp_file_path).unlink()
+
     def test_configurable_chunk_size_used_in_reading(self):
         """設定されたchunk_sizeがファイル読み込みに使用されることを確認"""
         # Given: 大きなテストファイルとカスタムchunk_size
@@ -163,6 +230,33 @@ class TestHasherXxhash:
             config = ScanConfig(hash_algorithm="invalid_algorithm")
             Hasher(config)
 
+    @pytest.mark.parametrize("algorithm", ["sha256", "md5", "sha512_256", "blake2b"])
+    def test_hash_factory_matches_hashlib(self, algorithm):
+        """初期化時に解決した生成関数がhashlibと同じダイジェストを返すことの検証"""
+        # Given: hashlibのアルゴリズムを指定したHasher
+        hasher = Hasher(hash_algorithm=algorithm)
+
+        # When: ハッシュオブジェクトを2回生成して同じデータを渡す
+        first = hasher._get_hash_object()
+        second = hasher._get_hash_object()
+        first.update(b"data")
+        second.update(b"data")
+
+        # Then: 独立したオブジェクトで、hashlibと同じ結果になる
+        import hashlib
+
+        if algorithm == "blake2b":
+            expected = hashlib.blake2b(b"data", digest_size=16).hexdigest()
+        else:
+            expected = hashlib.new(algorithm, b"data").hexdigest()
+        assert first is not second
+        assert first.hexdigest() == second.hexdigest() == expected
+
+    def test_invalid_hash_algorithm_rejected_by_hasher(self):
+        """Hasherに直接無効なアルゴリズムを渡すと初期化時にエラーになることの検証"""
+        with pytest.raises(ValueError, match="Unsupported hash algorithm"):
+            Hasher(hash_algorithm="invalid_algorithm")
+
     def test_scan_config_positional_with_hash_algorithm_raises_error(self):
         """ScanConfigを位置引数で渡した際にhash_algorithmを同時指定するとエラー"""
         config = ScanConfig()
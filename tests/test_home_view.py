@@ -2,7 +2,11 @@
 HomeViewのテストモジュール
 """
 
-from unittest.mock import patch
+import asyncio
+import stat
+from unittest.mock import Mock, patch
+
+import flet as ft
 
 from src.ui.home_view import HomeView
 
@@ -25,17 +29,15 @@ class TestHomeView:
         assert isinstance(home_view.selected_folders, list)
         assert len(home_view.selected_folders) == 0
 
-    @patch("pathlib.Path.exists")
-    @patch("pathlib.Path.is_dir")
-    def test_add_folder_valid_path(self, mock_is_dir, mock_exists):
+    @patch("src.ui.home_view.os.stat")
+    def test_add_folder_valid_path(self, mock_stat):
         """
         Given: 有効なフォルダパスが提供されたとき
         When: add_folderメソッドを呼び出す
         Then: フォルダがリストに追加される
         """
         # Given
-        mock_exists.return_value = True
-        mock_is_dir.return_value = True
+        mock_stat.return_value = Mock(st_mode=stat.S_IFDIR)
         home_view = HomeView()
         valid_path = "/Users/test/Documents"
 
@@ -46,17 +48,15 @@ class TestHomeView:
         assert valid_path in home_view.selected_folders
         assert len(home_view.selected_folders) == 1
 
-    @patch("pathlib.Path.exists")
-    @patch("pathlib.Path.is_dir")
-    def test_add_folder_duplicate_path(self, mock_is_dir, mock_exists):
+    @patch("src.ui.home_view.os.stat")
+    def test_add_folder_duplicate_path(self, mock_stat):
         """
         Given: 既に追加されているフォルダパスが提供されたとき
         When: add_folderメソッドを呼び出す
         Then: 重複して追加されない
         """
         # Given
-        mock_exists.return_value = True
-        mock_is_dir.return_value = True
+        mock_stat.return_value = Mock(st_mode=stat.S_IFDIR)
         home_view = HomeView()
         path = "/Users/test/Documents"
         home_view.add_folder(path)
@@ -68,17 +68,15 @@ class TestHomeView:
         assert len(home_view.selected_folders) == 1
         assert home_view.selected_folders[0] == path
 
-    @patch("pathlib.Path.exists")
-    @patch("pathlib.Path.is_dir")
-    def test_remove_folder_existing_path(self, mock_is_dir, mock_exists):
+    @patch("src.ui.home_view.os.stat")
+    def test_remove_folder_existing_path(self, mock_stat):
         """
         Given: フォルダがリストに存在するとき
         When: remove_folderメソッドを呼び出す
         Then: フォルダがリストから削除される
         """
         # Given
-        mock_exists.return_value = True
-        mock_is_dir.return_value = True
+        mock_stat.return_value = Mock(st_mode=stat.S_IFDIR)
         home_view = HomeView()
         path1 = "/Users/test/Documents"
         path2 = "/Users/test/Pictures"
@@ -93,6 +91,78 @@ class TestHomeView:
         assert path2 in home_view.selected_folders
         assert len(home_view.selected_folders) == 1
 
+    @patch("src.ui.home_view.os.stat")
+    def test_remove_folder_button_click(self, mock_stat):
+        """
+        Given: フォルダリストが表示されているとき
+        When: フォルダの削除ボタンがクリックされる
+        Then: 対応するフォルダがリストから削除される
+        """
+        # Given
+        mock_stat.return_value = Mock(st_mode=stat.S_IFDIR)
+        home_view = HomeView()
+        home_view.page = Mock()
+        path = "/Users/test/Documents"
+        home_view.add_folder(path)
+        asyncio.run(home_view._flush_folder_ui())
+        delete_button = home_view.folder_list.controls[0].trailing
+
+        # When
+        delete_button.on_click(Mock(control=delete_button))
+
+        # Then
+        assert home_view.selected_folders == []
+
+    @patch("src.ui.home_view.os.stat")
+    def test_add_folder_burst_schedules_single_flush(self, mock_stat):
+        """
+        Given: ページが設定されたHomeView
+        When: add_folderを連続して呼び出す
+        Then: UI更新は1回だけ予約され、反映後に全フォルダが表示される
+        """
+        # Given
+        mock_stat.return_value = Mock(st_mode=stat.S_IFDIR)
+        home_view = HomeView()
+        home_view.page = Mock()
+        paths = [f"/Users/test/folder{i}" for i in range(10)]
+
+        # When
+        for path in paths:
+            home_view.add_folder(path)
+
+        # Then
+        home_view.page.run_task.assert_called_once_with(home_view._flush_folder_ui)
+        home_view.page.update.assert_not_called()
+
+        # When
+        asyncio.run(home_view._flush_folder_ui())
+
+        # Then
+        assert len(home_view.folder_list.controls) == len(paths)
+        assert home_view.start_button.disabled is False
+        home_view.page.update.assert_called_once()
+
+    def test_show_snack_reuses_instance(self):
+        """
+        Given: ページが設定されたHomeView
+        When: 異なるメッセージでSnackBarを2回表示する
+        Then: 同じSnackBarインスタンスが内容を変えて再利用される
+        """
+        # Given
+        home_view = HomeView()
+        home_view.page = Mock()
+
+        # When
+        home_view._show_snack("First", ft.Colors.GREEN_600)
+        first_snack = home_view.page.snack_bar
+        home_view._show_snack("Second", ft.Colors.RED_600)
+
+        # Then
+        assert home_view.page.snack_bar is first_snack
+        assert first_snack.content.value == "Second"
+        assert first_snack.bgcolor == ft.Colors.RED_600
+        assert first_snack.open is True
+
     def test_remove_folder_nonexistent_path(self):
         """
         Given: フォルダがリストに存在しないとき
@@ -107,17 +177,15 @@ class TestHomeView:
         home_view.remove_folder(path)  # エラーが発生しないはず
         assert len(home_view.selected_folders) == 0
 
-    @patch("pathlib.Path.exists")
-    @patch("pathlib.Path.is_dir")
-    def test_clear_folders(self, mock_is_dir, mock_exists):
+    @patch("src.ui.home_view.os.stat")
+    def test_clear_folders(self, mock_stat):
         """
         Given: フォルダがリストに存在するとき
         When: clear_foldersメソッドを呼び出す
         Then: すべてのフォルダが削除される
         """
         # Given
-        mock_exists.return_value = True
-        mock_is_dir.return_value = True
+        mock_stat.return_value = Mock(st_mode=stat.S_IFDIR)
         home_view = HomeView()
         home_view.add_folder("/Users/test/Documents")
         home_view.add_folder("/Users/test/Pictures")
@@ -128,17 +196,15 @@ class TestHomeView:
         # Then
         assert len(home_view.selected_folders) == 0
 
-    @patch("pathlib.Path.exists")
-    @patch("pathlib.Path.is_dir")
-    def test_can_start_scan_with_folders(self, mock_is_dir, mock_exists):
+    @patch("src.ui.home_view.os.stat")
+    def test_can_start_scan_with_folders(self, mock_stat):
         """
         Given: フォルダが選択されているとき
         When: can_start_scanメソッドを呼び出す
         Then: Trueが返される
         """
         # Given
-        mock_exists.return_value = True
-        mock_is_dir.return_value = True
+        mock_stat.return_value = Mock(st_mode=stat.S_IFDIR)
         home_view = HomeView()
         home_view.add_folder("/Users/test/Documents")
 
@@ -163,17 +229,15 @@ class TestHomeView:
         # Then
         assert result is False
 
-    @patch("pathlib.Path.exists")
-    @patch("pathlib.Path.is_dir")
-    def test_is_valid_folder_valid_directory(self, mock_is_dir, mock_exists):
+    @patch("src.ui.home_view.os.stat")
+    def test_is_valid_folder_valid_directory(self, mock_stat):
         """
         Given: 有効なディレクトリパスが提供されたとき
         When: _is_valid_folderメソッドを呼び出す
         Then: Trueが返される
         """
         # Given
-        mock_exists.return_value = True
-        mock_is_dir.return_value = True
+        mock_stat.return_value = Mock(st_mode=stat.S_IFDIR)
         home_view = HomeView()
         path = "/Users/real/Documents"  # テスト用パス以外を使用
 
@@ -182,18 +246,17 @@ class TestHomeView:
 
         # Then
         assert result is True
-        mock_exists.assert_called_once()
-        mock_is_dir.assert_called_once()
+        mock_stat.assert_called_once_with(path)
 
-    @patch("pathlib.Path.exists")
-    def test_is_valid_folder_nonexistent_path(self, mock_exists):
+    @patch("src.ui.home_view.os.stat")
+    def test_is_valid_folder_nonexistent_path(self, mock_stat):
         """
         Given: 存在しないパスが提供されたとき
         When: _is_valid_folderメソッドを呼び出す
         Then: Falseが返される
         """
         # Given
-        mock_exists.return_value = False
+        mock_stat.side_effect = FileNotFoundError
         home_view = HomeView()
         path = "/Users/real/Nonexistent"  # テスト用パス以外を使用
 
@@ -203,17 +266,15 @@ class TestHomeView:
         # Then
         assert result is False
 
-    @patch("pathlib.Path.exists")
-    @patch("pathlib.Path.is_dir")
-    def test_is_valid_folder_file_path(self, mock_is_dir, mock_exists):
+    @patch("src.ui.home_view.os.stat")
+    def test_is_valid_folder_file_path(self, mock_stat):
         """
         Given: ファイルパスが提供されたとき
         When: _is_valid_folderメソッドを呼び出す
         Then: Falseが返される
         """
         # Given
-        mock_exists.return_value = True
-        mock_is_dir.return_value = False
+        mock_stat.return_value = Mock(st_mode=stat.S_IFREG)
         home_view = HomeView()
         path = "/Users/test/file.txt"
 
@@ -1,7 +1,10 @@
 """Tests for MainView integration with optimized scanning."""
 
+import asyncio
 import tempfile
+from collections.abc import Callable, Coroutine
 from pathlib import Path
+from typing import Any
 from unittest.mock import Mock, patch
 
 import flet as ft
@@ -26,6 +29,14 @@ class DummyPage:
     def update(self) -> None:  # pragma: no cover - no behavior needed
         """No-op update hook."""
 
+    def run_task(self, handler: Callable[[], Coroutine[Any, Any, None]]) -> None:
+        """Run a coroutine handler to completion.
+
+        Args:
+            handler: Coroutine function scheduled by the view.
+        """
+        asyncio.run(handler())
+
     def add(self, control: ft.Control) -> None:
         """Add a control to the page.
 
@@ -100,7 +111,7 @@ class TestMainViewOptimizedIntegration:
                 # The config should be created with optimal defaults
                 mock_config_class.assert_called_once_with(
                     chunk_size=65536,
-                    hash_algorithm="xxhash64",
+                    hash_algorithm="xxh3_128",
                     parallel_workers=4,
                     storage_type="ssd",
                 )
@@ -165,6 +176,29 @@ class TestMainViewOptimizedIntegration:
             duplicate_paths = sorted(file.path for file in groups[0].files)
             assert duplicate_paths == sorted([str(duplicate_a), str(duplicate_b)])
 
+    def test_full_scan_reuses_persistent_hash_cache(
+        self, tmp_path: Path, isolated_cache_home: Path
+    ):
+        """Test that a second scan of unchanged files is served from the hash cache."""
+        # Given: A folder with duplicates that has been scanned once
+        for name in ("dup_a.txt", "dup_b.txt"):
+            (tmp_path / name).write_text("duplicate data")
+        main_view = MainView(DummyPage())
+        main_view.selected_folders = [str(tmp_path)]
+        main_view._on_start_scan_clicked(Mock())
+        assert (isolated_cache_home / "duplicate_scan").is_dir()
+
+        # When: Scanning again with cache writes (i.e. cache misses) disabled
+        with patch(
+            "src.services.hash_cache.HashCache.set",
+            side_effect=AssertionError("file was rehashed"),
+        ):
+            main_view._on_start_scan_clicked(Mock())
+
+        # Then: The duplicates are still found from cached hashes
+        assert main_view.results_view is not None
+        assert len(main_view.results_view.duplicate_groups) == 1
+
     def test_old_compute_hashes_method_removed(self):
         """Test that _compute_hashes method is removed from MainView."""
         # Given
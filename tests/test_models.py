@@ -52,6 +52,22 @@ class TestFileMeta:
         assert isinstance(file_meta.partial_hash, str)
         assert isinstance(file_meta.full_hash, str)
 
+    def test_file_meta_uses_slots(self):
+        """Test FileMeta stores fields in slots and hashes stay assignable."""
+        # Given
+        file_meta = FileMeta(
+            path="/path/to/file.txt",
+            size=1024,
+            modified_time=datetime(2024, 1, 1),
+        )
+
+        # When
+        file_meta.partial_hash = "abc123"
+
+        # Then
+        assert not hasattr(file_meta, "__dict__")
+        assert file_meta.partial_hash == "abc123"
+
 
 class TestDuplicateGroup:
     """Test DuplicateGroup dataclass."""
@@ -100,3 +116,25 @@ class TestDuplicateGroup:
         assert isinstance(duplicate_group.total_size, int)
         assert len(duplicate_group.files) == 1
         assert isinstance(duplicate_group.files[0], FileMeta)
+
+    def test_duplicate_group_total_size_is_cached(self):
+        """Test total_size is summed once and reused on later access."""
+        # Given
+        duplicate_group = DuplicateGroup(
+            files=[
+                FileMeta(
+                    path=f"/path/to/file{i}.txt",
+                    size=1024,
+                    modified_time=datetime(2024, 1, 1),
+                )
+                for i in range(2)
+            ]
+        )
+
+        # When
+        first = duplicate_group.total_size
+
+        # Then
+        assert first == 2048
+        assert duplicate_group.__dict__["total_size"] == 2048
+        assert duplicate_group.total_size is first
@@ -89,6 +89,31 @@ class TestProgressView:
         assert progress_view.count_label.value == "150/100"
         mock_page.update.assert_called_once()
 
+    def test_update_progress_skips_unchanged_state(self) -> None:
+        """
+        Given: 進捗が一度表示されたProgressView
+        When: 表示上同じ進捗で再度更新する
+        Then: ページの更新が省略されること
+        """
+        # Given
+        progress_view = ProgressView()
+        mock_page = Mock()
+        progress_view.page = mock_page
+        progress_view.update_progress("Hashing", 1, 3)
+
+        # When
+        progress_view.update_progress("Hashing", 1, 3)
+
+        # Then
+        mock_page.update.assert_called_once()
+
+        # When
+        progress_view.update_progress("Hashing", 2, 3)
+
+        # Then
+        assert progress_view.progress_bar.value == 0.667
+        assert mock_page.update.call_count == 2
+
     def test_set_indeterminate(self) -> None:
         """不定モード設定のテスト"""
         # Given: ProgressViewとページ
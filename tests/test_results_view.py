@@ -2,6 +2,7 @@
 ResultsViewのテスト
 """
 
+import asyncio
 import pytest
 from datetime import datetime
 from unittest.mock import Mock
@@ -105,6 +106,56 @@ class TestResultsView:
         assert view.duplicate_groups == sample_duplicate_groups
         assert view.page.update.called
 
+    def test_set_duplicate_groups_renders_cards_in_chunks(self, sample_files) -> None:
+        """
+        Given: ページが設定されたResultsViewと多数の重複グループ
+        When: 重複グループを設定し、非同期描画を実行する
+        Then: 描画は非同期タスクに委ねられ、チャンクごとにページが更新されること
+        """
+        # Given
+        view = ResultsView()
+        view.page = Mock()
+        groups = [DuplicateGroup(files=sample_files[:2]) for _ in range(120)]
+
+        # When
+        view.set_duplicate_groups(groups)
+
+        # Then
+        view.page.run_task.assert_called_once()
+        assert view.groups_column.controls == []
+
+        # When
+        view.page.update.reset_mock()
+        asyncio.run(view.page.run_task.call_args.args[0]())
+
+        # Then
+        assert len(view.groups_column.controls) == 120
+        assert view.page.update.call_count == 3
+
+    def test_set_duplicate_groups_twice_before_render_shows_latest_once(
+        self, sample_files
+    ) -> None:
+        """
+        Given: ページが設定されたResultsView
+        When: 描画タスクの開始前に重複グループを2回続けて設定し、両タスクを実行する
+        Then: 古いタスクは何も追加せず、最新のグループのカードだけが1回ずつ表示されること
+        """
+        # Given
+        view = ResultsView()
+        view.page = Mock()
+        first_groups = [DuplicateGroup(files=sample_files[:2]) for _ in range(3)]
+        second_groups = [DuplicateGroup(files=sample_files[:2]) for _ in range(2)]
+
+        # When
+        view.set_duplicate_groups(first_groups)
+        view.set_duplicate_groups(second_groups)
+        for call in view.page.run_task.call_args_list:
+            asyncio.run(call.args[0]())
+
+        # Then
+        assert view.page.run_task.call_count == 2
+        assert len(view.groups_column.controls) == 2
+
     def test_toggle_file_selection(self, sample_duplicate_groups) -> None:
         """
         Given: ResultsViewと重複グループ
@@ -120,13 +171,13 @@ class TestResultsView:
         view.toggle_file_selection(target_file)
 
         # Then - 選択されていること
-        assert target_file in view.selected_files
+        assert id(target_file) in view.selected_files
 
         # When - 選択解除
         view.toggle_file_selection(target_file)
 
         # Then - 選択解除されていること
-        assert target_file not in view.selected_files
+        assert id(target_file) not in view.selected_files
 
     def test_toggle_file_selection_updates_delete_button(
         self, sample_duplicate_groups
@@ -149,6 +200,24 @@ class TestResultsView:
         assert view.delete_button.disabled is False
         assert view.page.update.called
 
+    def test_checkbox_change_toggles_selection(self, sample_duplicate_groups) -> None:
+        """
+        Given: ResultsViewと重複グループ
+        When: チェックボックスのon_changeが発火する
+        Then: 対応するファイルの選択状態が切り替わること
+        """
+        # Given
+        view = ResultsView()
+        view.set_duplicate_groups(sample_duplicate_groups)
+        target_file = sample_duplicate_groups[0].files[0]
+        checkbox = view.file_checkboxes[id(target_file)]
+
+        # When
+        checkbox.on_change(Mock(control=checkbox))
+
+        # Then
+        assert view.get_selected_files() == [target_file]
+
     def test_get_selected_files(self, sample_duplicate_groups) -> None:
         """
         Given: ResultsViewと重複グループ